@@ -0,0 +1,63 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "blog" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "blog" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "blogs" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "blogs" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "branch" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "branch" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "contact_us" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "contact_us" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "eventdate" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "eventdate" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "events" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "events" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "faqs" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "faqs" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "files" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "files" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "gallery" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "gallery" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "mail_email" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "mail_email" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "permission_groups" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "permission_groups" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "permissions" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "permissions" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "social" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "social" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "subscribers" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "subscribers" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "team" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "team" ALTER COLUMN "created_at" SET NOT NULL;
+        UPDATE "users" SET "created_at" = COALESCE("updated_at", CURRENT_TIMESTAMP) WHERE "created_at" IS NULL;
+        ALTER TABLE "users" ALTER COLUMN "created_at" SET NOT NULL;
+        CREATE INDEX IF NOT EXISTS "idx_blog_created_78fa21" ON "blog" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_events_created_559494" ON "events" ("created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_team_created_f5abc3" ON "team" ("created_at", "id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_team_created_f5abc3";
+        DROP INDEX IF EXISTS "idx_events_created_559494";
+        DROP INDEX IF EXISTS "idx_blog_created_78fa21";
+        ALTER TABLE "blog" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "blogs" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "branch" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "contact_us" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "eventdate" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "events" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "faqs" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "files" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "gallery" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "mail_email" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "permission_groups" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "permissions" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "social" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "subscribers" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "team" ALTER COLUMN "created_at" DROP NOT NULL;
+        ALTER TABLE "users" ALTER COLUMN "created_at" DROP NOT NULL;"""
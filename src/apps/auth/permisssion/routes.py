@@ -13,7 +13,7 @@ from src.apps.auth.permisssion.schemas import (
 )
 from src.apps.auth.user.services import UserService
 from src.apps.auth.permisssion.models import Permission, PermissionGroup
-from src.apps.auth.user import User
+from src.apps.auth.user.schemas import Principal
 from src.enums.base import Action, Resource
 from src.dependencies.permissions.base import AuthPermissionService
 from src.core.cache import cache
@@ -29,7 +29,7 @@ permission_group_route = build_router(path="permission-groups", tags=["Permissio
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.AUTH))]
 )
-@cache(ttl=300)
+@cache(ttl=300, tags=["permissions:*"])
 async def list_permissions(request: Request):
     return  await PermissionModelService.fetch_all_permissions()
 
@@ -48,8 +48,8 @@ async def create_permission(dto: PermissionSchema):
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.AUTH))]
 )
-@cache(ttl=600)
-async def get_permission(permission_id: str, request: Request, current_user: User = Depends(UserService.jwt.get_current_user)):
+@cache(ttl=600, tags=["permissions:*", "permission:{permission_id}"], vary_on=["user", "permissions"])
+async def get_permission(permission_id: str, request: Request, current_user: Principal = Depends(UserService.jwt.get_current_user)):
     return await PermissionModelService.fetch_permission_by_id(permission_id)
 
 
@@ -58,7 +58,7 @@ async def get_permission(permission_id: str, request: Request, current_user: Use
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.UPDATE, resource=Resource.AUTH))]
 )
-async def update_permission(permission_id: str, dto: PermissionSchema, current_user: User = Depends(UserService.jwt.get_current_user)):
+async def update_permission(permission_id: str, dto: PermissionSchema, current_user: Principal = Depends(UserService.jwt.get_current_user)):
     return await PermissionModelService.update_permission(permission_id, dto)
 
 
@@ -67,7 +67,7 @@ async def update_permission(permission_id: str, dto: PermissionSchema, current_u
     status_code=204,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.DELETE, resource=Resource.AUTH))]
 )
-async def delete_permission(permission_id: str, current_user: User = Depends(UserService.jwt.get_current_user)):
+async def delete_permission(permission_id: str, current_user: Principal = Depends(UserService.jwt.get_current_user)):
     return await PermissionModelService.delete_permission(permission_id)
 
 
@@ -2,6 +2,7 @@ from src.apps.auth.permisssion import Permission, PermissionGroup
 from src.error.base import ErrorHandler
 from src.utilities.base_service import BaseObjectService
 from src.apps.auth.permisssion.schemas import PermissionSchema, PermissionGroupSchema
+from src.core.cache import CachingService
 
 
 class PermissionModelService:
@@ -15,7 +16,9 @@ class PermissionModelService:
 
     @classmethod
     async def create_permission(cls, dto: PermissionSchema):
-        return await cls.model.create(**dto.dict(exclude_unset=True))
+        permission = await cls.model.create(**dto.dict(exclude_unset=True))
+        await CachingService.invalidate("permissions:*")
+        return permission
 
     @classmethod
     async def update_permission(cls, permission_id: str, dto: PermissionSchema):
@@ -25,6 +28,7 @@ class PermissionModelService:
         for attr, value in dto.dict(exclude_unset=True).items():
             setattr(permission, attr, value)
         await permission.save()
+        await CachingService.invalidate("permissions:*")
         return permission
 
     @classmethod
@@ -41,6 +45,7 @@ class PermissionModelService:
             raise cls.error.not_found()
         permission.is_deleted = True
         await permission.save()
+        await CachingService.invalidate("permissions:*")
         return permission
 
 
@@ -96,6 +101,7 @@ class PermissionGroupModelService:
                     raise ErrorHandler(Permission).not_found()
                 await group.permissions.add(permission)
         await group.save()
+        await CachingService.invalidate("permissions:*")
         return group
 
     @classmethod
@@ -115,4 +121,6 @@ class PermissionGroupModelService:
 
     @classmethod
     async def delete_permission_group(cls, group_id: str):
-        return await cls.boa.trash(id=group_id)
+        group = await cls.boa.trash(id=group_id)
+        await CachingService.invalidate("permissions:*")
+        return group
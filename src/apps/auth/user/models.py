@@ -1,6 +1,7 @@
 from src.utilities.base_model import BaseModel
 from tortoise import fields
-from src.utilities.hash import set_password
+from typing import Optional
+from src.utilities.hash import set_password_async
 
 
 class User(BaseModel):
@@ -27,17 +28,34 @@ class User(BaseModel):
     longitude = fields.FloatField(null=True)
 
 
+    # Plain password waiting to be hashed on the next save
+    _pending_password: Optional[str] = None
+
     class Meta:
         ordering = ["created_at", "updated_at"]
         table = "users"
 
+    def __init__(self, **kwargs):
+        password = kwargs.pop("password", None)
+        super().__init__(**kwargs)
+        if password:
+            self.set_password(password)
+
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
 
 
+    def set_password(self, password: str):
+        """
+        Change the password. It is hashed once, on the next `save()`;
+        saves that don't touch the password never hash anything.
+        """
+        self._pending_password = password
+
     async def save(self, *args, **kwargs):
-        if self.password: 
-            self.password = set_password(self.password)
+        if self._pending_password:
+            self.password = await set_password_async(self._pending_password)
+            self._pending_password = None
         await super().save(*args, **kwargs)
 
 
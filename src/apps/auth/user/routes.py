@@ -1,15 +1,20 @@
 from fastapi import Request, Depends, Response, Query, Cookie
-from src.apps.auth.user import User
 from typing import Optional
 from src.utilities.route_builder import build_router
-from src.apps.auth.user.schemas import UserCreateDto, UserLogin, UserObjectDto, UpdateUserSchema
+from src.core.ratelimit import RateLimit
+from src.apps.auth.user.schemas import UserCreateDto, UserLogin, UserObjectDto, UpdateUserSchema, Principal
 from src.apps.auth.user.services import UserService
 from src.utilities.crypto import JWTService
 from src.enums.base import Action, Resource
 from src.dependencies.permissions.base import AuthPermissionService
 from src.core.cache import cache   # ✅ added
 
-user_route = build_router(path="users", tags=["User"])
+user_route = build_router(
+    path="users",
+    tags=["User"],
+    # Logout revokes tokens, so a throttled client must still reach it
+    rate_limit=RateLimit(per_minute=10, burst=5, methods=("POST",), exempt=("/logout",)),
+)
 jwt = JWTService()
 
 
@@ -49,13 +54,22 @@ async def login(dto: UserLogin, request: Request, response: Response):
     return await UserService.login_user(dto=dto, request=request, response=response)
 
 
+# -------------------- LOGOUT -------------------- #
+@user_route.post(
+    "/logout", 
+    status_code=204
+)
+async def logout(request: Request, response: Response):
+    return await UserService.logout_user(request=request, response=response)
+
+
 # -------------------- WHOAMI -------------------- #
 @user_route.get(
     "/whoami", 
     status_code=200, 
 )
 # @cache(ttl=120)   # ✅ Cache for 2 minutes (since user details may change)
-async def user_profile(request: Request, current_user: User = Depends(UserService.jwt.get_current_user)):
+async def user_profile(request: Request, current_user: Principal = Depends(UserService.jwt.get_current_user)):
     return current_user
 
 
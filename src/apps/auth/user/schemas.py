@@ -49,6 +49,25 @@ class UserObjectDto(BaseModel):
             from_attributes = True
 
 
+class Principal(BaseModel):
+    """The authenticated user as request handlers see it: a cached snapshot, not an ORM row."""
+    id: UUID
+    email: EmailStr
+    first_name: str
+    last_name: str
+    other_name: Optional[str] = None
+    phone_number: Optional[str] = None
+    is_active: bool
+    is_verified: bool
+    is_superuser: bool
+    is_staff: bool
+    profile_picture_id: Optional[UUID] = None
+    last_login: Optional[datetime] = None
+
+    class Config:
+            from_attributes = True
+
+
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -7,10 +7,15 @@ from src.error.base import ErrorHandler
 from src.apps.auth.user.schemas import UserCreateDto, UserLogin, UpdateUserSchema
 from src.libs.smtp.mailer import EmailService
 from src.utilities.crypto import JWTService
+from src.core.revocation import TokenDenylist
+from src.core.ratelimit import LoginThrottle
 from src.utilities.meta import get_ipaddr
 from tortoise import timezone
-from src.utilities.hash import verify_password
+from src.utilities.hash import needs_rehash, verify_password_async
+from src.utilities.pagination import fetch_page
+from src.enums.base import TotalMode
 from src.apps.file.models import File
+from src.core.cache import CachingService, CacheUnavailable
 from tortoise.expressions import Q
 from typing import Optional
 
@@ -41,6 +46,7 @@ class UserService:
             user.profile_picture = image
         user.ip_address = ip_addr
         await user.save()
+        await CachingService.invalidate("user:*")
         await Subscriber.create(email=dto.email)
         token = cls.jwt.generate_token(str(user.id))
         response.set_cookie(
@@ -67,21 +73,26 @@ class UserService:
 
     @classmethod
     async def login_user(cls, dto: UserLogin, request: Request, response: Response):
+        ip_address = get_ipaddr(request=request)
+        await LoginThrottle.check(ip_address, dto.email)
         user = await cls.boa.get_object_or_404(email=dto.email)
         if not user:
             raise cls.error.get(400)
-        password = verify_password(hashed_password=user.password, plain_password=dto.password)
-        if password is not None:
-            user.last_login = timezone.now()
-        ip_address = get_ipaddr(request=request)
+        if not user.password or not await verify_password_async(hashed_password=user.password, plain_password=dto.password):
+            raise cls.error.get(400, "Invalid email or password")
+        await LoginThrottle.reset(dto.email)
+        if needs_rehash(user.password):
+            # Upgrade to the current Argon2 profile while we have the plain password
+            user.set_password(dto.password)
+        user.last_login = timezone.now()
         if ip_address != user.ip_address and dto.device_id != user.device_id:
             user.ip_address = ip_address
             user.device_id = dto.device_id
             user.is_active = False
-            await user.save()
         user.latitude = dto.latitude
-        user.logitude = dto.longitude
+        user.longitude = dto.longitude
         await user.save()
+        await CachingService.invalidate(f"principal:{user.id}")
         token = cls.jwt.generate_token(str(user.id))
 
         response.set_cookie(
@@ -103,6 +114,19 @@ class UserService:
             path="/"
         )  
 
+    @classmethod
+    async def logout_user(cls, request: Request, response: Response):
+        tokens = [request.cookies.get("access_token"), request.cookies.get("refresh_token")]
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer":
+            tokens.append(credentials)
+        try:
+            await cls.jwt.revoke_tokens(*filter(None, tokens))
+        except CacheUnavailable:
+            raise cls.error.get(503, "Could not sign out right now, please try again")
+        response.delete_cookie("access_token", path="/", secure=True, httponly=True, samesite="none")
+        response.delete_cookie("refresh_token", path="/", secure=True, httponly=True, samesite="none")
+
     @classmethod
     async def all(
         cls,
@@ -122,11 +146,9 @@ class UserService:
         if is_verified is not None:
             query = query.filter(is_verified=is_verified)
 
-        # Now run count() on the QuerySet
-        total_count = await query.count()
-
-        # Fetch paginated users
-        users = await query.offset(offset).limit(limit)
+        # The listing isn't response-cached, so cache the count per filter set instead;
+        # signups and profile updates clear it
+        users, total_count = await fetch_page(query, offset, limit, TotalMode.CACHED, ["user:*"])
 
         results = []
         for user in users:
@@ -219,13 +241,15 @@ class UserService:
 
     @classmethod
     async def update_user(cls, id: str, dto: UpdateUserSchema):
-        user = await cls.boa.get_object(id=id)
+        user = await cls.boa.get_object_or_404(id=id)
         if not user:
-            return await cls.error.not_found("User not found")
+            raise cls.error.get(404, "User not found")
 
-        data = dto.dict(exclude_unset=True, exclude={"profile_image", "permission_groups_ids"})
+        data = dto.dict(exclude_unset=True, exclude={"profile_image", "permission_groups_ids", "password"})
         for key, value in data.items():
             setattr(user, key, value)
+        if dto.password:
+            user.set_password(dto.password)
 
         if dto.permission_groups_ids:
             await user.permission_groups.clear()
@@ -239,10 +263,15 @@ class UserService:
             img = await cls.file.model.get_or_none(id=dto.profile_picture_id)
             if img:
                 user.profile_image = img
-        return await user.save()
+        saved = await user.save()
+        # The compiled mask also depends on is_superuser, so any update may change it
+        await CachingService.invalidate(f"principal:{user.id}", f"permissions:{user.id}", "user:*")
+        return saved
    
     @classmethod
     async def refresh_access(cls, refresh_token: str, response: Response):
+        if await TokenDenylist.is_revoked(cls.jwt.decode_token(refresh_token).get("jti")):
+            raise cls.error.get(401, "Token revoked")
         new_tokens = cls.jwt.refresh_token(refresh_token)
 
         response.set_cookie(
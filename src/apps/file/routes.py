@@ -34,6 +34,6 @@ async def upload_to_cloudinary(file: UploadFile):
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.FILE))]
 )
-@cache(ttl=300)  # ✅ Cache for 5 minutes — standard for list endpoints
+@cache(ttl=300, vary_on=["permissions"], tags=["file:*"])  # ✅ Cache for 5 minutes per permission set
 async def list_files(request: Request):
     return await FileService.list()
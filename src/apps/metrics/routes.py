@@ -0,0 +1,17 @@
+from fastapi import Depends
+from src.utilities.route_builder import build_router
+from src.core.metrics import Metrics
+from src.enums.base import Action, Resource
+from src.dependencies.permissions.base import AuthPermissionService
+
+metrics_router = build_router(path="metrics", tags=["Metrics"])
+
+
+@metrics_router.get(
+    "/",
+    status_code=200,
+    dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.AUTH))]
+)
+async def get_metrics():
+    """Counters of the worker that served this request."""
+    return Metrics.snapshot()
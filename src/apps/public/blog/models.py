@@ -52,5 +52,6 @@ class Blog(BaseModel):
             ('title',),
             ('slug',),
             ('category', 'author'),
-            ('tags',)
+            ('tags',),
+            ('created_at', 'id'),  # keyset pagination
         ]
@@ -3,7 +3,7 @@ from src.utilities.route_builder import build_router
 from src.apps.public.blog.services import BlogService, CategoryService
 from src.utilities.crypto import JWTService
 from src.apps.public.blog.schemas import CategorySchema, BlogSchema
-from src.apps.auth.user import User
+from src.apps.auth.user.schemas import Principal
 from src.core.cache import cache
 from src.enums.base import Action, Resource
 from uuid import UUID
@@ -19,13 +19,13 @@ jwt = JWTService()
 # =======================
 
 @category_router.get("/", status_code=200)
-# @cache(ttl=600)  # ✅ Cache for 10 minutes (categories rarely change)
+@cache(ttl=600, tags=["category:*"])  # ✅ Cache for 10 minutes (categories rarely change)
 async def get_categories(request: Request):
     return await CategoryService.all()
 
 
 @category_router.get("/{id}", status_code=200)
-# @cache(ttl=600)  # ✅ Cache for 10 minutes per category
+@cache(ttl=600, tags=["category:{id}"])  # ✅ Cache for 10 minutes per category
 async def get_category(id: str, request: Request):
     return await CategoryService.get(id)
 
@@ -35,7 +35,7 @@ async def get_category(id: str, request: Request):
     status_code=201,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.CREATE, resource=Resource.PUBLIC))]
 )
-async def create_category(dto: CategorySchema, user: User = Depends(jwt.get_current_user)):
+async def create_category(dto: CategorySchema, user: Principal = Depends(jwt.get_current_user)):
     return await CategoryService.create(user=user, dto=dto)
 
 
@@ -62,13 +62,20 @@ async def delete_category(id: str):
 # =======================
 
 @blogs_router.get("/", status_code=200)
-# @cache(ttl=300)  # ✅ Cache for 5 minutes (blog lists change more often)
-async def list_blogs(request: Request, author: str = Query(None), category: str = Query(None)):
-    return await BlogService.all(author=author, category=category)
+@cache(ttl=300, tags=["blog:*", "category:*"], stale_ttl=900, conditional=True)  # ✅ Cache for 5 minutes, then serve stale while refreshing
+async def list_blogs(
+    request: Request,
+    author: str = Query(None),
+    category: str = Query(None),
+    page: int = Query(1, ge=1, description="Page number"),
+    count: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str = Query(None, description="`next_cursor` from the previous page; takes precedence over `page`"),
+):
+    return await BlogService.all(author=author, category=category, page=page, count=count, cursor=cursor)
 
 
 @blogs_router.get("/{slug_or_id}", status_code=200)
-# @cache(ttl=600)  # ✅ Cache for 10 minutes per blog post
+@cache(ttl=600, tags=["blog:{slug_or_id}", "category:*"], conditional=True, negative_ttl=30)  # ✅ Cache for 10 minutes per blog post
 async def get_blog(slug_or_id: str, request: Request):
     try:
         UUID(slug_or_id)
@@ -82,7 +89,7 @@ async def get_blog(slug_or_id: str, request: Request):
     status_code=201,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.CREATE, resource=Resource.PUBLIC))]
 )
-async def create_blog(dto: BlogSchema, task: BackgroundTasks, user: User = Depends(jwt.get_current_user)):
+async def create_blog(dto: BlogSchema, task: BackgroundTasks, user: Principal = Depends(jwt.get_current_user)):
     return await BlogService.create(user=user, dto=dto, task=task)
 
 
@@ -2,7 +2,7 @@ from src.utilities.base_service import BaseObjectService
 from src.apps.public.blog import Blog, Category
 from src.error.base import ErrorHandler
 from src.enums.base import ContentStatus
-from src.apps.auth.user import User
+from src.apps.auth.user.schemas import Principal
 from slugify import slugify
 from src.apps.file import File
 from fastapi import BackgroundTasks
@@ -10,6 +10,10 @@ from src.libs.smtp.mailer import EmailService
 from src.libs.smtp.templates.newsnevent import content_email
 from src.apps.public.blog.schemas import CategorySchema, BlogSchema
 from src.apps.public.subscribers.models import Subscriber
+from src.core.cache import CachingService
+from src.core.warmer import CacheWarmer
+from src.apps.file.services import FileService
+from src.utilities.pagination import paginate
 
 
 
@@ -20,9 +24,11 @@ class CategoryService:
 
 
     @classmethod
-    async def create(cls, user: User, dto: CategorySchema):
-        print(user)
-        return await cls.boa.model.create(**dto.dict(exclude_unset=True), added_by=user)
+    async def create(cls, user: Principal, dto: CategorySchema):
+        category = await cls.boa.model.create(**dto.dict(exclude_unset=True), added_by_id=user.id)
+        await CachingService.invalidate_object("category", category.id)
+        CacheWarmer.schedule()
+        return category
        
     
 
@@ -65,12 +71,18 @@ class CategoryService:
             setattr(category, field, value)
         if "title" in data and data["title"]:
             category.slug = slugify(data["title"])
-        return await category.save()
+        saved = await category.save()
+        await CachingService.invalidate_object("category", category.id)
+        CacheWarmer.schedule()
+        return saved
     
 
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.delete(id=id)
+        deleted = await cls.boa.delete(id=id)
+        await CachingService.invalidate_object("category", id)
+        CacheWarmer.schedule()
+        return deleted
  
 
 
@@ -82,15 +94,17 @@ class BlogService:
     subscribers = Subscriber 
 
     @classmethod
-    async def create(cls, user: User, dto: BlogSchema, task: BackgroundTasks):
+    async def create(cls, user: Principal, dto: BlogSchema, task: BackgroundTasks):
         blog = cls.boa.model(**dto.dict(exclude={"author"}))
-        blog.author = user
+        blog.author_id = user.id
         await blog.save()
         if dto.image_ids:
-            for image_id in dto.image_ids:
-                image = await cls.file.model.get_or_none(id=image_id)
-                if image:
-                    await blog.images.add(image)
+            images = await cls.file.get_many(dto.image_ids)
+            if images:
+                await blog.images.add(*images.values())
+
+        await CachingService.invalidate_object("blog", blog.id, blog.slug)
+        CacheWarmer.schedule("/v1/blogs/")
 
         images = await blog.images.all()
         image_url = images[0].url 
@@ -109,11 +123,11 @@ class BlogService:
 
 
     @classmethod
-    async def all(cls, author: str | None = None, category: str | None = None, page: int = 1, count: int = 10):
+    async def all(cls, author: str | None = None, category: str | None = None, page: int = 1, count: int = 10, cursor: str | None = None):
         query = cls.boa.model.filter(
             is_deleted=False,
             status=ContentStatus.PUBLISH
-        ).select_related("author", "category").prefetch_related("images")  # M2M
+        ).select_related("author", "category")
 
         if author:
             query = query.filter(
@@ -125,10 +139,8 @@ class BlogService:
         if category:
             query = query.filter(category__title__icontains=category)
 
-        total = await query.count()
-        offset = (page - 1) * count
-        query = query.offset(offset).limit(count)
-        blogs = await query.all()
+        blogs, page_info = await paginate(query, page, count, cursor)
+        images = await FileService.image_urls(Blog, [blog.id for blog in blogs])
 
         results = []
         for blog in blogs:
@@ -140,19 +152,14 @@ class BlogService:
                 "status": blog.status,
                 "category": blog.category.title if blog.category else None,
                 "author": f"{blog.author.first_name} {blog.author.last_name}" if blog.author else None,
-                "images": [image.url for image in blog.images],
+                "images": images[str(blog.id)],
                 "tags": blog.tags, 
                 "views_count": blog.views_count,
                 "created_at": blog.created_at,
                 "updated_at": blog.updated_at,
             })
 
-        return {
-            "page": page,
-            "page_size": count,
-            "total": total,
-            "data": results,
-        }
+        return {**page_info, "data": results}
 
 
     @classmethod
@@ -167,10 +174,11 @@ class BlogService:
         elif slug:
             query = query.filter(slug=slug)
         
-        blog = await query.prefetch_related("images").select_related("category", "author").first()
+        blog = await query.select_related("category", "author").first()
         
         if not blog:
             raise cls.error.get(404, "Blog not found")
+        images = await FileService.image_urls(Blog, [blog.id])
         return {
                 "id": str(blog.id),
                 "title": blog.title,
@@ -179,7 +187,7 @@ class BlogService:
                 "status": blog.status,
                 "category": blog.category.title if blog.category else None,
                 "author": f"{blog.author.first_name} {blog.author.last_name}" if blog.author else None,
-                "images": [image.url for image in blog.images],
+                "images": images[str(blog.id)],
                 "tags": blog.tags, 
                 "views_count": blog.views_count,
                 "created_at": blog.created_at,
@@ -191,6 +199,7 @@ class BlogService:
         blog = await cls.boa.get_object_or_404(id=id)
         if not blog:
             raise cls.error.get(404, "Blog not found")
+        old_slug = blog.slug
 
         data = dto.dict(exclude_unset=True, exclude={"author"})
         for field, value in data.items():
@@ -199,8 +208,15 @@ class BlogService:
         if "title" in data and data["title"]:
             blog.slug = slugify(data["title"])
 
-        return await blog.save()
+        saved = await blog.save()
+        await CachingService.invalidate_object("blog", blog.id, old_slug, blog.slug)
+        CacheWarmer.schedule("/v1/blogs/")
+        return saved
 
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.delete(id=id)
\ No newline at end of file
+        blog = await cls.boa.get_object_or_404(id=id)
+        deleted = await cls.boa.delete(id=id)
+        await CachingService.invalidate_object("blog", id, blog.slug if blog else None)
+        CacheWarmer.schedule("/v1/blogs/")
+        return deleted
\ No newline at end of file
@@ -46,3 +46,6 @@ class Team(BaseModel):
 
     class Meta:
         table = "team"
+        indexes = [
+            ('created_at', 'id'),  # keyset pagination
+        ]
@@ -1,5 +1,6 @@
 from fastapi import BackgroundTasks, Query, Depends, Request
 from src.utilities.route_builder import build_router
+from src.core.ratelimit import RateLimit
 from src.apps.public.contact.services import SocialService, BranchService, ContactUsService, TeamService
 from src.apps.public.contact.schemas import SocialSchema, BranchSchema, ContactUsSchema, TeamSchema
 from src.core.cache import cache
@@ -28,12 +29,12 @@ async def update_social(id: str, data: SocialSchema):
     return await SocialService.update(id, data)
 
 @social_router.get("/{id}", status_code=200)
-# @cache(ttl=900)  # ✅ Cache 15 minutes for individual social record
+@cache(ttl=900, tags=["social:{id}"])  # ✅ Cache 15 minutes for individual social record
 async def get_social(id: str, request: Request):
     return await SocialService.get(id=id)
 
 @social_router.get("/", status_code=200)
-# @cache(ttl=900)  # ✅ Cache 15 minutes for all social links
+@cache(ttl=900, tags=["social:*"])  # ✅ Cache 15 minutes for all social links
 async def list_social(request: Request):
     return await SocialService.all()
 
@@ -68,12 +69,12 @@ async def update_branch(id: str, data: BranchSchema):
     return await BranchService.update(id, data)
 
 @branch_router.get("/{id}", status_code=200)
-# @cache(ttl=1800)  # ✅ Cache 30 minutes (branch details rarely change)
+@cache(ttl=1800, tags=["branch:{id}"])  # ✅ Cache 30 minutes (branch details rarely change)
 async def get_branch(id: str, request: Request):
     return await BranchService.get(id=id)
 
 @branch_router.get("/", status_code=200)
-# @cache(ttl=1800)  # ✅ Cache 30 minutes (list of branches)
+@cache(ttl=1800, tags=["branch:*"])  # ✅ Cache 30 minutes (list of branches)
 async def list_branch(request: Request):
     return await BranchService.all()
 
@@ -89,7 +90,11 @@ async def delete_branch(id: str):
 # -----------------------------
 # ContactUs Router
 # -----------------------------
-contact_router = build_router(path="contact-us", tags=["ContactUs"])
+contact_router = build_router(
+    path="contact-us",
+    tags=["ContactUs"],
+    rate_limit=RateLimit(per_minute=2, burst=3, route_per_minute=60, methods=("POST",)),
+)
 
 @contact_router.post(
     "/",
@@ -111,7 +116,7 @@ async def update_contact(id: str, data: ContactUsSchema):
         status_code=200,
         dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.PUBLIC))]
         )
-# @cache(ttl=900)  # ✅ Cache 15 minutes
+@cache(ttl=900, tags=["contact:{id}"])  # ✅ Cache 15 minutes
 async def get_contact(id: str, request: Request):
     return await ContactUsService.get(id=id)
 
@@ -120,7 +125,7 @@ async def get_contact(id: str, request: Request):
         status_code=200,
         dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.PUBLIC))]
         )
-# @cache(ttl=900)  # ✅ Cache 15 minutes (list of contact requests)
+@cache(ttl=900, tags=["contact:*"])  # ✅ Cache 15 minutes (list of contact requests)
 async def list_contact(request: Request):
     return await ContactUsService.all()
 
@@ -147,19 +152,20 @@ async def update_team(id: str, data: TeamSchema):
     return await TeamService.update(id, data)
 
 @team_router.get("/{id}", status_code=200)
-# @cache(ttl=900)  # ✅ Cache 15 minutes per team member
+@cache(ttl=900, tags=["team:{id}", "social:*"])  # ✅ Cache 15 minutes per team member
 async def get_team(id: str, request: Request):
     return await TeamService.get(id=id)
 
 @team_router.get("/", status_code=200)
-# @cache(ttl=900)  # ✅ Uncomment if you want caching for 15 mins
+@cache(ttl=900, tags=["team:*", "social:*"])  # ✅ Cache 15 minutes
 async def list_team(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of records per page"),
+    cursor: str = Query(None, description="`next_cursor` from the previous page; takes precedence over `page`"),
 ):
 
-    return await TeamService.all(page=page, page_size=page_size)
+    return await TeamService.all(page=page, page_size=page_size, cursor=cursor)
 
 
 @team_router.delete(
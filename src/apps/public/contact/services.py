@@ -8,6 +8,9 @@ from src.error.base import ErrorHandler
 from src.apps.file.models import File
 from tortoise.queryset import QuerySet
 from src.apps.public.contact.schemas import ContactUsSchema, TeamSchema, BranchSchema, SocialSchema
+from src.core.cache import CachingService
+from src.core.warmer import CacheWarmer
+from src.utilities.pagination import paginate
 
 
 class SocialService:
@@ -16,7 +19,9 @@ class SocialService:
 
     @classmethod
     async def create(cls, dto: SocialSchema):
-        return await cls.boa.model.create(**dto.dict())
+        obj = await cls.boa.model.create(**dto.dict())
+        await CachingService.invalidate_object("social", obj.id)
+        return obj
 
     @classmethod
     async def update(cls, id: str, dto: SocialSchema):
@@ -26,6 +31,7 @@ class SocialService:
         for field, value in dto.dict(exclude_unset=True).items():
             setattr(obj, field, value)
         await obj.save()
+        await CachingService.invalidate_object("social", obj.id)
         return obj
 
     @classmethod
@@ -41,7 +47,9 @@ class SocialService:
     
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.trash(id=id)
+        obj = await cls.boa.trash(id=id)
+        await CachingService.invalidate_object("social", id)
+        return obj
 
 
 
@@ -51,7 +59,9 @@ class BranchService:
 
     @classmethod
     async def create(cls, dto: BranchSchema):
-        return await cls.boa.model.create(**dto.dict())
+        obj = await cls.boa.model.create(**dto.dict())
+        await CachingService.invalidate_object("branch", obj.id)
+        return obj
 
     @classmethod
     async def update(cls, id: str, dto: BranchSchema):
@@ -61,6 +71,7 @@ class BranchService:
         for field, value in dto.dict(exclude_unset=True).items():
             setattr(obj, field, value)
         await obj.save()
+        await CachingService.invalidate_object("branch", obj.id)
         return obj
 
     @classmethod
@@ -78,7 +89,9 @@ class BranchService:
 
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.trash(id=id)
+        obj = await cls.boa.trash(id=id)
+        await CachingService.invalidate_object("branch", id)
+        return obj
 
 
 class ContactUsService:
@@ -89,6 +102,7 @@ class ContactUsService:
     @classmethod
     async def create(cls, dto: ContactUsSchema, background_tasks: BackgroundTasks):
         contact_obj = await cls.boa.model.create(**dto.dict())
+        await CachingService.invalidate_object("contact", contact_obj.id)
 
         body = contact(dto.sender_name)
         background_tasks.add_task(
@@ -113,6 +127,7 @@ class ContactUsService:
         for field, value in dto.dict(exclude_unset=True).items():
             setattr(obj, field, value)
         await obj.save()
+        await CachingService.invalidate_object("contact", obj.id)
         return obj
 
     @classmethod
@@ -151,7 +166,10 @@ class TeamService:
                 obj, _ = await Social.get_or_create(**social.dict())
                 social_objs.append(obj)
             await team.socials.add(*social_objs)
+            await CachingService.invalidate("social:*")
 
+        await CachingService.invalidate_object("team", team.id)
+        CacheWarmer.schedule("/v1/team/")
         return team
 
 
@@ -187,7 +205,10 @@ class TeamService:
                 else:
                     new_social = await cls.social_boa.model.create(**social_data.dict())
                     await obj.socials.add(new_social)
+            await CachingService.invalidate("social:*")
 
+        await CachingService.invalidate_object("team", obj.id)
+        CacheWarmer.schedule("/v1/team/")
         return obj
 
     @classmethod
@@ -228,6 +249,7 @@ class TeamService:
         page_size: int = 10,
         prefetch: Optional[List[str]] = None,
         select: Optional[List[str]] = None,
+        cursor: Optional[str] = None,
     ):
         query: QuerySet = cls.boa.model.filter(is_deleted=False)
         if prefetch:
@@ -240,8 +262,7 @@ class TeamService:
         else:
             query = query.select_related("image")
 
-        total = await query.count()
-        teams = await query.offset((page - 1) * page_size).limit(page_size)
+        teams, page_info = await paginate(query, page, page_size, cursor)
 
         results = []
         for team in teams:
@@ -266,16 +287,14 @@ class TeamService:
                 "updated_at": team.updated_at,
             })
 
-        return {
-            "page": page,
-            "page_size": page_size,
-            "total": total,
-            "data": results,
-        }
+        return {**page_info, "data": results}
 
 
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.trash(id=id)
+        obj = await cls.boa.trash(id=id)
+        await CachingService.invalidate_object("team", id)
+        CacheWarmer.schedule("/v1/team/")
+        return obj
     
 
@@ -28,6 +28,7 @@ class Event(BaseModel):
         indexes = [
             ('title',),
             ('slug',),
+            ('created_at', 'id'),  # keyset pagination
         ]
 
 
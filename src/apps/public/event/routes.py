@@ -1,9 +1,9 @@
 from uuid import UUID
-from fastapi import Depends, Query, Path, Body, BackgroundTasks
+from fastapi import Depends, Query, Path, Body, BackgroundTasks, Request
 from src.utilities.route_builder import build_router
 from src.apps.public.event.services import EventService, EventDateService
 from src.apps.public.event.schemas import EventSchema, EventDateSchema
-from src.apps.auth.user import User
+from src.apps.auth.user.schemas import Principal
 from src.utilities.crypto import JWTService
 from src.core.cache import cache
 
@@ -18,21 +18,23 @@ jwt = JWTService()
 # ==============================
 # Event Routes
 # # ==============================
-# @cache(ttl=60)  # Cache for 1 minute
 @event_router.get("/", status_code=200)
+@cache(ttl=60, tags=["event:*"], stale_ttl=300, conditional=True)  # Cache for 1 minute, then serve stale while refreshing
 async def all_events(
+    request: Request,
     added_by: str | None = Query(None, description="Filter by added_by's name"),
     category: str | None = Query(None, description="Filter by category"),
     page: int = Query(1, ge=1, description="Page number"),
     count: int = Query(10, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="`next_cursor` from the previous page; takes precedence over `page`"),
 ):
     """List all events with optional filters and pagination."""
-    return await EventService.all(added_by=added_by, category=category, page=page, count=count)
+    return await EventService.all(added_by=added_by, category=category, page=page, count=count, cursor=cursor)
 
 
-# @cache(ttl=120)  # Cache for 2 minutes
 @event_router.get("/{slug_or_id}", status_code=200)
-async def get_event(slug_or_id: str):
+@cache(ttl=120, tags=["event:{slug_or_id}"], conditional=True, negative_ttl=30)  # Cache for 2 minutes
+async def get_event(slug_or_id: str, request: Request):
     """Get a single event by ID (UUID) or slug."""
     try:
         UUID(slug_or_id)
@@ -49,7 +51,7 @@ async def get_event(slug_or_id: str):
 async def create_event(
     dto: EventSchema,
     task: BackgroundTasks,
-    user: User = Depends(jwt.get_current_user)
+    user: Principal = Depends(jwt.get_current_user)
 ):
     """Create a new event."""
     return await EventService.create(user=user, dto=dto, task=task)
@@ -63,7 +65,7 @@ async def create_event(
 async def update_event(
     id: str = Path(..., description="Event ID"),
     dto: EventSchema = Body(...),
-    user: User = Depends(jwt.get_current_user),
+    user: Principal = Depends(jwt.get_current_user),
 ):
     """Update an event by ID."""
     return await EventService.update(id, dto)
@@ -92,9 +94,9 @@ async def create_event_date(dto: EventDateSchema):
     return await EventDateService.create(dto=dto)
 
 
-# @cache(ttl=60)
 @event_router.get("/dates/{event_id}", status_code=200)
-async def get_event_date(event_id: str):
+@cache(ttl=60, tags=["event-date:{event_id}"])
+async def get_event_date(event_id: str, request: Request):
     """Get all dates for a specific event."""
     return await EventDateService.get(event_id=event_id)
 
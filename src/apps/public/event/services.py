@@ -4,12 +4,16 @@ from src.error.base import ErrorHandler
 from src.enums.base import ContentStatus
 from slugify import slugify
 from src.apps.file import File
-from src.apps.auth.user import User
+from src.apps.auth.user.schemas import Principal
 from src.apps.public.event.schemas import EventSchema, EventDateSchema
 from fastapi import BackgroundTasks
 from src.libs.smtp.mailer import EmailService
 from src.libs.smtp.templates.newsnevent import content_email
 from src.apps.public.subscribers.models import Subscriber
+from src.core.cache import CachingService
+from src.core.warmer import CacheWarmer
+from src.apps.file.services import FileService
+from src.utilities.pagination import paginate
 
 
 
@@ -23,11 +27,11 @@ class EventService:
     smtp = EmailService()
 
     @classmethod
-    async def all(cls, added_by: str | None = None, category: str | None = None, page: int = 1, count: int = 10):
+    async def all(cls, added_by: str | None = None, category: str | None = None, page: int = 1, count: int = 10, cursor: str | None = None):
         query = cls.boa.model.filter(
             is_deleted=False,
             status=ContentStatus.PUBLISH
-        ).select_related("added_by").prefetch_related("images")  # M2M
+        ).select_related("added_by")
 
         if added_by:
             query = query.filter(
@@ -39,10 +43,8 @@ class EventService:
         if category:
             query = query.filter(category__title__icontains=category)
 
-        total = await query.count()
-        offset = (page - 1) * count
-        query = query.offset(offset).limit(count)
-        events = await query.all()
+        events, page_info = await paginate(query, page, count, cursor)
+        images = await FileService.image_urls(Event, [event.id for event in events])
 
         results = []
         for event in events:
@@ -54,31 +56,28 @@ class EventService:
                 "status": event.status,
                 "venue": event.venue,
                 "added_by": f"{event.added_by.first_name} {event.added_by.last_name}" if event.added_by else None,
-                "images": [image.url for image in event.images],
+                "images": images[str(event.id)],
                 # "map_link": event.map_link,
                 "created_at": event.created_at,
                 "updated_at": event.updated_at,
             })
 
-        return {
-            "page": page,
-            "page_size": count,
-            "total": total,
-            "data": results,
-        }
+        return {**page_info, "data": results}
 
     @classmethod
-    async def create(cls, user: User, dto: EventSchema, task: BackgroundTasks):
+    async def create(cls, user: Principal, dto: EventSchema, task: BackgroundTasks):
         event = await cls.boa.model.create(
             **dto.dict(exclude={"image_ids"}),
-            added_by=user
+            added_by_id=user.id
         )
 
         if dto.image_ids:
-            for image_id in dto.image_ids:
-                image = await cls.file.model.get_or_none(id=image_id)
-                if image:
-                    await event.images.add(image)
+            images = await cls.file.get_many(dto.image_ids)
+            if images:
+                await event.images.add(*images.values())
+        await CachingService.invalidate_object("event", event.id, event.slug)
+        CacheWarmer.schedule("/v1/events/")
+
         images = await event.images.all()
         image_url = images[0].url 
         content = content_email(title=event.title, image=image_url, id=event.id, content_type="events")
@@ -95,25 +94,32 @@ class EventService:
     
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.trash(id=id)
+        event = await cls.boa.trash(id=id)
+        if event:
+            await CachingService.invalidate_object("event", event.id, event.slug)
+            CacheWarmer.schedule("/v1/events/")
+        return event
     
     @classmethod
     async def update(cls, id: str, dto: EventSchema):
         event = await cls.boa.get_object_or_404(id=id)
         if not event:
             raise cls.error.get(404, "Event not found")
+        old_slug = event.slug
         data = dto.dict(exclude_unset=True, exclude={"added_by"})
         for field, value in data.items():
             setattr(event, field, value)
         if "title" in data and data["title"]:
             event.slug = slugify(data["title"])
         if dto.image_ids:
-            for image_id in dto.image_ids:
-                image = await cls.file.model.get_or_none(id=image_id)
-                if image:
-                    await event.images.add(image)
-
-        return await event.save()
+            images = await cls.file.get_many(dto.image_ids)
+            if images:
+                await event.images.add(*images.values())
+
+        saved = await event.save()
+        await CachingService.invalidate_object("event", event.id, old_slug, event.slug)
+        CacheWarmer.schedule("/v1/events/")
+        return saved
     
     @classmethod
     async def get(cls, id: str | None = None, slug: str | None = None):
@@ -128,10 +134,11 @@ class EventService:
         elif slug:
             query = query.filter(slug=slug)
         
-        event = await query.prefetch_related("images").select_related("added_by").first()
+        event = await query.select_related("added_by").first()
         
         if not event:
             raise cls.error.get(404, "Event not found")
+        images = await FileService.image_urls(Event, [event.id])
         
         return {
             "id": str(event.id),
@@ -141,7 +148,7 @@ class EventService:
             "status": event.status,
             "venue": event.venue,
             "added_by": f"{event.added_by.first_name} {event.added_by.last_name}" if event.added_by else None,
-            "images": [image.url for image in event.images],
+            "images": images[str(event.id)],
             "created_at": event.created_at,
             "updated_at": event.updated_at,
         }
@@ -153,7 +160,9 @@ class EventDateService:
 
     @classmethod
     async def create(cls, dto: EventDateSchema):
-        return await cls.boa.model.create(**dto.dict())
+        event_date = await cls.boa.model.create(**dto.dict())
+        await CachingService.invalidate(f"event-date:{event_date.event_id}")
+        return event_date
     
 
     @classmethod 
@@ -170,9 +179,14 @@ class EventDateService:
         for key, value in update_data.items():
             setattr(instance, key, value)
 
-        return await instance.save()
+        saved = await instance.save()
+        await CachingService.invalidate(f"event-date:{instance.event_id}")
+        return saved
        
 
     @classmethod
     async def delete(cls, event_date_id: str):
-        return await cls.boa.trash(id=event_date_id)
\ No newline at end of file
+        event_date = await cls.boa.trash(id=event_date_id)
+        if event_date:
+            await CachingService.invalidate(f"event-date:{event_date.event_id}")
+        return event_date
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from src.utilities.route_builder import build_router
 from src.apps.public.faq.schema import FAQSchema
 from src.apps.public.faq.service import FAQService
@@ -21,17 +21,17 @@ from src.dependencies.permissions.base import AuthPermissionService
 async def create_faq(dto: FAQSchema):
     return await FAQService.create(dto=dto)
 
-# @cache(ttl=120)
 @faq_router.get(
         "/", 
         status_code=200
         )
-async def list_faqs(author: str | None = None, category: str | None = None):
+@cache(ttl=120, tags=["faq:*", "category:*"], conditional=True)
+async def list_faqs(request: Request, author: str | None = None, category: str | None = None):
     return await FAQService.all(author=author, category=category)
 
-# @cache(ttl=120)
 @faq_router.get("/{id}", status_code=200)
-async def get_faq(id: str):
+@cache(ttl=120, tags=["faq:{id}", "category:*"])
+async def get_faq(id: str, request: Request):
     return await FAQService.get(id=id)
 
 
@@ -3,6 +3,8 @@ from src.utilities.base_service import BaseObjectService
 from src.apps.public.faq import FAQ
 from src.apps.public.faq.schema import FAQSchema
 from src.error.base import ErrorHandler
+from src.core.cache import CachingService
+from src.core.warmer import CacheWarmer
 
 class FAQService:
     boa = BaseObjectService(FAQ)
@@ -13,7 +15,10 @@ class FAQService:
         data = dto.dict()
         if not data.get("slug") and data.get("question"):
             data["slug"] = slugify(data["question"])
-        return await cls.boa.model.create(**data)
+        faq = await cls.boa.model.create(**data)
+        await CachingService.invalidate_object("faq", faq.id)
+        CacheWarmer.schedule("/v1/faqs/")
+        return faq
 
     @classmethod
     async def all(cls, author: str | None = None, category: str | None = None):
@@ -40,8 +45,13 @@ class FAQService:
         if not obj.slug and obj.question:
             obj.slug = slugify(obj.question)
         await obj.save()
+        await CachingService.invalidate_object("faq", obj.id)
+        CacheWarmer.schedule("/v1/faqs/")
         return obj
 
     @classmethod
     async def delete(cls, id: str):
-        return await cls.boa.trash(id=id)
+        faq = await cls.boa.trash(id=id)
+        await CachingService.invalidate_object("faq", id)
+        CacheWarmer.schedule("/v1/faqs/")
+        return faq
@@ -1,4 +1,4 @@
-from fastapi import Depends, Query
+from fastapi import Depends, Query, Request
 from src.utilities.route_builder import build_router
 from src.apps.public.gallery.schema import GallerySchema
 from src.apps.public.gallery.service import GalleryService
@@ -20,24 +20,25 @@ async def create_gallery(dto: GallerySchema):
     return await GalleryService.create(dto=dto)
 
 
-# @cache(ttl=180)  # ✅ Cached for 3 minutes
 @gallery_router.get(
     "/", 
     status_code=200
 )
+@cache(ttl=180, tags=["gallery:*", "category:*"], conditional=True)  # ✅ Cached for 3 minutes
 async def list_galleries(
+    request: Request,
     author: str | None = None, 
     category: str | None = None
 ):
     return await GalleryService.all(author=author, category=category)
 
 
-# @cache(ttl=240)  # ✅ Cached for 4 minutes
 @gallery_router.get(
     "/{id}", 
     status_code=200
 )
-async def get_gallery(id: str):
+@cache(ttl=240, tags=["gallery:{id}", "category:*"])  # ✅ Cached for 4 minutes
+async def get_gallery(id: str, request: Request):
     return await GalleryService.get(id=id)
 
 
@@ -61,6 +62,6 @@ async def delete_gallery(id: str):
 
   # ✅ Cached for 2 minutes
 @gallery_router.get("/search/", status_code=200)
-# @cache(ttl=120)
-async def search_galleries(q: str = Query(..., description="Search galleries by keyword")):
+@cache(ttl=120, tags=["gallery:*", "category:*"])
+async def search_galleries(request: Request, q: str = Query(..., description="Search galleries by keyword")):
     return await GalleryService.search(query=q)
@@ -5,11 +5,13 @@ from src.utilities.base_service import BaseObjectService
 from src.apps.public.gallery import Gallery
 from src.apps.public.gallery.schema import GallerySchema
 from src.error.base import ErrorHandler
-from src.apps.file.models import File 
+from src.apps.file.models import File
+from src.core.cache import CachingService
 
 
 class GalleryService:
     boa = BaseObjectService(Gallery)
+    file = BaseObjectService(File)
     error = ErrorHandler(Gallery)
 
     @classmethod
@@ -23,11 +25,11 @@ class GalleryService:
        
         image_ids = data.get("image_ids", [])
         if image_ids:
-            for image_id in image_ids:
-                image = await File.get_or_none(id=image_id)
-                if image:
-                    await gallery.images.add(image)
+            images = await cls.file.get_many(image_ids)
+            if images:
+                await gallery.images.add(*images.values())
 
+        await CachingService.invalidate_object("gallery", gallery.id)
         return gallery
 
     @classmethod
@@ -71,12 +73,12 @@ class GalleryService:
         # ✅ Handle images
         if "image_ids" in update_data:
             await obj.images.clear()
-            for image_id in update_data["image_ids"]:
-                image = await File.get_or_none(id=image_id)
-                if image:
-                    await obj.images.add(image)
+            images = await cls.file.get_many(update_data["image_ids"])
+            if images:
+                await obj.images.add(*images.values())
 
         await obj.save()
+        await CachingService.invalidate_object("gallery", obj.id)
         return obj
 
     @classmethod
@@ -85,6 +87,7 @@ class GalleryService:
         if not obj:
             return await cls.error.not_found("Gallery not found")
         await obj.delete()
+        await CachingService.invalidate_object("gallery", id)
         return {"message": "Gallery deleted successfully"}
 
     @classmethod
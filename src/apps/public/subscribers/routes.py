@@ -1,12 +1,17 @@
-from fastapi import BackgroundTasks, Depends
+from fastapi import BackgroundTasks, Depends, Request
 from src.utilities.route_builder import build_router
+from src.core.ratelimit import RateLimit
 from src.apps.public.subscribers.services import SubscriberService
 from src.apps.public.subscribers.schemas import SubscriberSchema
 from src.core.cache import cache  # ✅ Added import
 from src.enums.base import Action, Resource
 from src.dependencies.permissions.base import AuthPermissionService
 
-subscriber_router = build_router(path="subscriber", tags=["Subscriber"])
+subscriber_router = build_router(
+    path="subscriber",
+    tags=["Subscriber"],
+    rate_limit=RateLimit(per_minute=3, burst=3, route_per_minute=120, methods=("POST",)),
+)
 
 @subscriber_router.post("/", status_code=201)
 async def create_subscriber(data: SubscriberSchema):
@@ -20,22 +25,22 @@ async def create_subscriber(data: SubscriberSchema):
 async def update_subscriber(id: str, data: SubscriberSchema):
     return await SubscriberService.update(id, data)
 
-# @cache(ttl=180)  # ✅ Cached for 3 minutes
 @subscriber_router.get(
     "/{id}",
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.PUBLIC))]
 )
-async def get_subscriber(id: str):
+@cache(ttl=180, tags=["subscriber:{id}"])  # ✅ Cached for 3 minutes
+async def get_subscriber(id: str, request: Request):
     return await SubscriberService.get(id=id)
 
-# @cache(ttl=180)  # ✅ Cached for 3 minutes
 @subscriber_router.get(
     "/",
     status_code=200,
     dependencies=[Depends(AuthPermissionService.permission_required(action=Action.READ, resource=Resource.PUBLIC))]
 )
-async def list_subscriber():
+@cache(ttl=180, tags=["subscriber:*"])  # ✅ Cached for 3 minutes
+async def list_subscriber(request: Request):
     return await SubscriberService.all()
 
 
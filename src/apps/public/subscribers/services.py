@@ -5,6 +5,8 @@ from src.utilities.base_service import BaseObjectService
 from src.apps.public.subscribers import Subscriber
 from src.error.base import ErrorHandler
 from src.apps.public.subscribers.schemas import SubscriberSchema  # reuse SubscriberSchema for email validation
+from src.core.cache import CachingService
+from src.enums.base import TotalMode
 
 
 class SubscriberService:
@@ -13,7 +15,9 @@ class SubscriberService:
 
     @classmethod
     async def create(cls, data: SubscriberSchema):
-        return await cls.boa.model.create(**data.dict())
+        obj = await cls.boa.model.create(**data.dict())
+        await CachingService.invalidate_object("subscriber", obj.id)
+        return obj
 
     @classmethod
     async def update(cls, id: str, data: SubscriberSchema):
@@ -23,6 +27,7 @@ class SubscriberService:
         for field, value in data.dict(exclude_unset=True).items():
             setattr(obj, field, value)
         await obj.save()
+        await CachingService.invalidate_object("subscriber", obj.id)
         return obj
 
     @classmethod
@@ -34,8 +39,11 @@ class SubscriberService:
 
     @classmethod
     async def all(cls):
-        return await cls.boa.all()
+        # Grows with every signup and is only read by staff: a planner estimate will do
+        return await cls.boa.all(total=TotalMode.ESTIMATE)
 
     @classmethod
     async def delete(cls, id):
-        return await cls.boa.trash(id=id)
+        obj = await cls.boa.trash(id=id)
+        await CachingService.invalidate_object("subscriber", id)
+        return obj
@@ -38,6 +38,38 @@ EMAIL_USER = str(os.getenv("EMAIL_USER"))
 EMAIL_PASSWORD = str(os.getenv("EMAIL_PASSWORD"))
 FRONTEND_URL = str(os.getenv('FRONTEND_URL'))
 
+PASSWORD_HASH_CONCURRENCY = int(os.getenv('PASSWORD_HASH_CONCURRENCY', max(1, (os.cpu_count() or 2) // 2)))
+ARGON2_PROFILE = str(os.getenv('ARGON2_PROFILE', 'argon2_profile.json'))  # written by `calibrate`
+DB_BULK_CHUNK_SIZE = int(os.getenv('DB_BULK_CHUNK_SIZE', 5000))
+LIST_COUNT_CACHE_TTL = int(os.getenv('LIST_COUNT_CACHE_TTL', 300))
+REDIS_HOST = str(os.getenv('REDIS_HOST', 'redis'))
+REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+CACHE_BACKEND = str(os.getenv('CACHE_BACKEND', 'redis'))  # 'redis' or 'memory'
+CACHE_TIMEOUT = float(os.getenv('CACHE_TIMEOUT', 0.5))
+CACHE_BREAKER_THRESHOLD = int(os.getenv('CACHE_BREAKER_THRESHOLD', 5))
+CACHE_BREAKER_COOLDOWN = float(os.getenv('CACHE_BREAKER_COOLDOWN', 15))
+CACHE_LOCAL_MAX_ENTRIES = int(os.getenv('CACHE_LOCAL_MAX_ENTRIES', 2048))
+CACHE_LOCAL_MAX_BYTES = int(os.getenv('CACHE_LOCAL_MAX_BYTES', 32 * 1024 * 1024))
+CACHE_LOCAL_TTL = int(os.getenv('CACHE_LOCAL_TTL', 30))
+CACHE_LOCK_TIMEOUT = int(os.getenv('CACHE_LOCK_TIMEOUT', 10))
+CACHE_CODEC = str(os.getenv('CACHE_CODEC', 'orjson'))
+CACHE_COMPRESSION = str(os.getenv('CACHE_COMPRESSION', 'auto'))
+CACHE_COMPRESS_MIN_BYTES = int(os.getenv('CACHE_COMPRESS_MIN_BYTES', 4096))
+CACHE_PRECOMPRESS_MIN_BYTES = int(os.getenv('CACHE_PRECOMPRESS_MIN_BYTES', 1000))  # GZipMiddleware's minimum_size
+CACHE_MAX_KEY_LENGTH = int(os.getenv('CACHE_MAX_KEY_LENGTH', 200))
+CACHE_WARM_PAGES = int(os.getenv('CACHE_WARM_PAGES', 3))
+CACHE_WARM_DELAY = float(os.getenv('CACHE_WARM_DELAY', 0.5))
+AUTH_PRINCIPAL_TTL = int(os.getenv('AUTH_PRINCIPAL_TTL', 60))
+AUTH_REVOCATION_BLOOM_BITS = int(os.getenv('AUTH_REVOCATION_BLOOM_BITS', 1 << 20))
+AUTH_REVOCATION_BLOOM_HASHES = int(os.getenv('AUTH_REVOCATION_BLOOM_HASHES', 7))
+AUTH_REVOCATION_REBUILD_INTERVAL = int(os.getenv('AUTH_REVOCATION_REBUILD_INTERVAL', 3600))
+TRUSTED_PROXY_HOPS = int(os.getenv('TRUSTED_PROXY_HOPS', 0))  # reverse proxies in front of the app that append X-Forwarded-For
+LOGIN_LIMIT_WINDOW = int(os.getenv('LOGIN_LIMIT_WINDOW', 300))
+LOGIN_LIMIT_PER_IP = int(os.getenv('LOGIN_LIMIT_PER_IP', 20))
+LOGIN_LIMIT_PER_EMAIL = int(os.getenv('LOGIN_LIMIT_PER_EMAIL', 5))
+LOGIN_BLOCK_BASE = int(os.getenv('LOGIN_BLOCK_BASE', 30))
+LOGIN_BLOCK_MAX = int(os.getenv('LOGIN_BLOCK_MAX', 3600))
+
 
 CORS_ALLOWED_ORIGINS = [
     origin.strip()
@@ -1,100 +1,501 @@
 # src/core/cache.py
 import redis.asyncio as redis
-import json
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+import orjson
 import logging
 import asyncio
-import enum
-import datetime
+import struct
 import uuid
-from typing import Optional, Any, Callable, Coroutine
-from fastapi import Request
-from functools import wraps
+import time
+import zlib
+import hashlib
+import datetime
+import enum
+from collections import OrderedDict
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import urlencode
+from typing import Optional, Any, Awaitable, Callable, Coroutine, Iterable, List, Set, Tuple, Dict
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
 from tortoise.models import Model
+from functools import wraps
+from src.core.metrics import Metrics
+from src.core.memory_backend import MemoryRedis
+from src.core.serializers import (
+    CacheEntry,
+    CachedResponse,
+    compress_frame,
+    decompress_frame,
+    dumps_entry,
+    dumps_json,
+    get_codec,
+    precompress,
+    get_compressor,
+    loads_entry,
+)
+from src.config.env import (
+    CACHE_LOCAL_MAX_ENTRIES,
+    CACHE_LOCAL_MAX_BYTES,
+    CACHE_LOCAL_TTL,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_MAX_KEY_LENGTH,
+    CACHE_BACKEND,
+    CACHE_TIMEOUT,
+    CACHE_BREAKER_THRESHOLD,
+    CACHE_BREAKER_COOLDOWN,
+    REDIS_HOST,
+    REDIS_PORT,
+)
 
 logger = logging.getLogger(__name__)
 
+TAG_PREFIX = "tag:"
+INVALIDATION_CHANNEL = "cache:invalidate"
+LOCK_PREFIX = "lock:"
+LOCK_POLL_INTERVAL = 0.05
+
+# Only the worker holding the lock may release it
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+async def _release_lock_in_memory(backend: MemoryRedis, keys: List[str], args: List[str]) -> int:
+    if await backend.get(keys[0]) == args[0].encode():
+        return await backend.delete(keys[0])
+    return 0
+
+
+MemoryRedis.register_script(RELEASE_LOCK_SCRIPT, _release_lock_in_memory)
+
+
+class LocalCache:
+    """
+    Bounded in-process TTL/LRU tier that sits in front of Redis.
+
+    Entries are kept decoded, so a hit costs neither a network round trip nor a
+    decode. The size of an entry is the length of its serialized form.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024, ttl: int = 30):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.evictions = 0
+        self._data: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self.delete(key)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, size: int, ttl: Optional[int] = None):
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        self.delete(key)
+        ttl = min(ttl, self.ttl) if ttl else self.ttl
+        self._data[key] = (time.monotonic() + ttl, size, value)
+        self.size += size
+        while len(self._data) > self.max_entries or self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self._data.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def delete(self, *keys: str):
+        for key in keys:
+            entry = self._data.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
 
-def _json_default(obj):
-    """Convert non-serializable objects to JSON-friendly formats."""
-    from tortoise.models import Model  # ensure correct import
+    def clear(self):
+        self._data.clear()
+        self.size = 0
 
-    if isinstance(obj, Model):
-        # Convert Tortoise ORM model to dict
-        return obj.__dict__  # includes _values and _meta info; or filter just your fields
-    if isinstance(obj, enum.Enum):
-        return obj.value
-    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
-        return obj.isoformat()
-    if isinstance(obj, uuid.UUID):
-        return str(obj)
-    # Fallback
-    return str(obj)
+    def stats(self) -> dict:
+        return {"local_entries": len(self._data), "local_bytes": self.size, "local_evictions": self.evictions}
+
+
+class CacheUnavailable(Exception):
+    """Redis is down, slow, or skipped by the circuit breaker; callers fall back to the database."""
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency for `cooldown` seconds after `threshold`
+    consecutive failures, then lets one trial call through to probe it.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 15):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.trips = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return False
+        # Re-arm before the trial so concurrent callers keep bypassing until it reports back
+        self.opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> bool:
+        """Returns True when this success closes a breaker that was open."""
+        recovered = self.opened_at is not None
+        self.failures = 0
+        self.opened_at = None
+        if recovered:
+            logger.info("Redis is reachable again, cache re-enabled")
+        return recovered
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures < self.threshold:
+            return
+        if self.opened_at is None:
+            self.trips += 1
+            logger.warning(f"Redis failed {self.failures} times in a row, bypassing the cache for {self.cooldown}s")
+        self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {"breaker_state": self.state, "breaker_trips": self.trips}
 
 
 class CachingService:
+    """
+    Redis-backed cache with a per-worker local tier in front of it.
+
+    Redis is optional at runtime: every call runs under a short timeout and a
+    circuit breaker, and when Redis can't be reached reads count as misses and
+    writes are dropped, so an outage costs cache hits rather than errors.
+    """
     _conn: Optional[redis.Redis] = None
+    _local = LocalCache(max_entries=CACHE_LOCAL_MAX_ENTRIES, max_bytes=CACHE_LOCAL_MAX_BYTES, ttl=CACHE_LOCAL_TTL)
+    _breaker = CircuitBreaker(threshold=CACHE_BREAKER_THRESHOLD, cooldown=CACHE_BREAKER_COOLDOWN)
+    _listener: Optional[asyncio.Task] = None
+    _codec = get_codec()
+    _compressor = get_compressor()
+    _inflight: Dict[str, asyncio.Task] = {}
+    _revalidating: Dict[str, asyncio.Task] = {}
+    _missed_tags: Set[str] = set()
+    _tasks: Set[asyncio.Task] = set()
+    _channels: Dict[str, Tuple[Callable[[bytes], Any], Optional[Callable[[], Awaitable[Any]]]]] = {}
 
     @classmethod
     async def open_conn(
         cls,
-        host="redis",
-        port=6379,
-        db=0,
-        max_connections=50,
-        retries=5,
-        delay=1,
+        host: str = REDIS_HOST,
+        port: int = REDIS_PORT,
+        db: int = 0,
+        max_connections: int = 50,
+        backend: str = CACHE_BACKEND,
     ):
-        if cls._conn is None:
-            for attempt in range(1, retries + 1):
-                try:
-                    cls._conn = redis.Redis(
-                        host=host,
-                        port=port,
-                        db=db,
-                        decode_responses=True,  # store strings
-                        max_connections=max_connections,
-                    )
-                    await cls._conn.ping()
-                    logger.info("Redis connection established")
-                    return cls._conn
-                except Exception as e:
-                    logger.warning(f"Attempt {attempt}: Redis not ready yet ({e})")
-                    cls._conn = None
-                    await asyncio.sleep(delay)
-            raise RuntimeError("Failed to connect to Redis after multiple attempts")
+        """
+        Create the client without waiting for Redis to answer. Until it does, calls
+        fail fast and requests are served from the database.
+        """
+        if cls._conn is not None:
+            return cls._conn
+        if backend == "memory":
+            cls._conn = MemoryRedis()
+            logger.info("Using the in-memory cache backend")
+            return cls._conn
+
+        cls._conn = redis.Redis(
+            host=host,
+            port=port,
+            db=db,
+            decode_responses=False,  # entries are binary frames
+            max_connections=max_connections,
+            socket_connect_timeout=CACHE_TIMEOUT,
+            # Fail fast and let the circuit breaker decide when to try again
+            retry=Retry(NoBackoff(), 0),
+        )
+        cls._listener = asyncio.create_task(cls._listen_for_invalidations())
+        logger.info(f"Redis client created for {host}:{port}")
+        return cls._conn
 
     @classmethod
     async def close_conn(cls):
+        if cls._listener:
+            cls._listener.cancel()
+            cls._listener = None
         if cls._conn:
             await cls._conn.close()
             cls._conn = None
             logger.info("Redis connection closed")
+        cls._local.clear()
+
+    @classmethod
+    def _check_available(cls, command: str):
+        if cls._conn is None or not cls._breaker.allow():
+            Metrics.incr("cache", "bypassed")
+            raise CacheUnavailable(command)
+
+    @classmethod
+    async def _guard(cls, awaitable: Awaitable[Any], command: str) -> Any:
+        try:
+            result = await asyncio.wait_for(awaitable, CACHE_TIMEOUT)
+        except (RedisError, OSError, asyncio.TimeoutError) as e:
+            cls._breaker.record_failure()
+            Metrics.incr("cache", "errors")
+            logger.warning(f"Redis {command} failed: {e!r}")
+            raise CacheUnavailable(command) from e
+        if cls._breaker.record_success() and cls._missed_tags:
+            cls._replay_invalidations()
+        return result
 
     @classmethod
-    async def set(cls, key: str, value: Any, ttl: int = 3600):
-        if cls._conn is None:
-            raise RuntimeError("Redis connection not initialized")
+    async def _call(cls, command: str, *args, **kwargs) -> Any:
+        """Run one Redis command under the circuit breaker and the per-call timeout."""
+        cls._check_available(command)
+        return await cls._guard(getattr(cls._conn, command)(*args, **kwargs), command)
 
+    @classmethod
+    def _pipeline(cls):
+        cls._check_available("pipeline")
+        return cls._conn.pipeline(transaction=False)
+
+    @classmethod
+    async def _execute(cls, pipe) -> List[Any]:
+        return await cls._guard(pipe.execute(), "pipeline")
+
+    @classmethod
+    def subscribe(cls, channel: str, handler: Callable[[bytes], Any], resync: Optional[Callable[[], Awaitable[Any]]] = None):
+        """
+        Run `handler(data)` for every message published on `channel`, on the same
+        connection as the invalidation listener. Messages sent while the listener
+        is reconnecting are lost, so `resync()` runs each time it (re)subscribes.
+        """
+        cls._channels[channel] = (handler, resync)
+
+    @classmethod
+    async def publish(cls, channel: str, data: bytes) -> int:
+        return await cls._call("publish", channel, data)
+
+    @classmethod
+    async def _listen_for_invalidations(cls):
+        """Evict keys other workers invalidated from this worker's local tier."""
+        delay = 1
+        while True:
+            try:
+                async with cls._conn.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL, *cls._channels)
+                    # Anything published while we were not listening is lost; start clean
+                    cls._local.clear()
+                    for _, resync in cls._channels.values():
+                        if resync:
+                            await resync()
+                    delay = 1
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        channel = message["channel"].decode()
+                        if channel == INVALIDATION_CHANNEL:
+                            cls._local.delete(*orjson.loads(message["data"]))
+                        else:
+                            cls._channels[channel][0](message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener disconnected ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30)
+
+    @classmethod
+    def _encode(cls, value: Any, fresh_until: Optional[float] = None) -> Tuple[CacheEntry, bytes]:
+        entry = CacheEntry(value=value, fresh_until=fresh_until)
+        return entry, dumps_entry(entry, cls._codec)
+
+    @classmethod
+    def _queue_set(cls, pipe, key: str, serialized: bytes, ttl: int, tags: Optional[Iterable[str]]):
+        pipe.set(key, compress_frame(serialized, cls._compressor), ex=ttl)
+        for tag in tags or ():
+            # A tag set must live at least as long as the longest key it points to
+            tag_key = f"{TAG_PREFIX}{tag}"
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, ttl, nx=True)
+            pipe.expire(tag_key, ttl, gt=True)
+
+    @classmethod
+    async def set(
+        cls,
+        key: str,
+        value: Any,
+        ttl: int = 3600,
+        tags: Optional[Iterable[str]] = None,
+        fresh_until: Optional[float] = None,
+    ):
+        entry, serialized = cls._encode(value, fresh_until)
+        cls._local.set(key, entry, len(serialized), ttl)
         try:
-            serialized = json.dumps(value, default=_json_default)
-            await cls._conn.set(key, serialized, ex=ttl)
-            logger.debug(f"Set key '{key}' in Redis (TTL={ttl}s)")
-        except Exception as e:
-            logger.error(f"Failed to set key '{key}' in Redis: {e}")
-            raise
+            pipe = cls._pipeline()
+            cls._queue_set(pipe, key, serialized, ttl, tags)
+            await cls._execute(pipe)
+        except CacheUnavailable:
+            return
+        logger.debug(f"Set key '{key}' in Redis (TTL={ttl}s)")
+
+    @classmethod
+    async def set_many(
+        cls,
+        mapping: Dict[str, Any],
+        ttl: int = 3600,
+        tags: Optional[Callable[[str], Iterable[str]]] = None,
+    ):
+        """Store several values in one pipelined round trip. `tags(key)` gives each key's tags."""
+        if not mapping:
+            return
+
+        encoded = {key: cls._encode(value) for key, value in mapping.items()}
+        for key, (entry, serialized) in encoded.items():
+            cls._local.set(key, entry, len(serialized), ttl)
+        try:
+            pipe = cls._pipeline()
+            for key, (_, serialized) in encoded.items():
+                cls._queue_set(pipe, key, serialized, ttl, tags(key) if tags else None)
+            await cls._execute(pipe)
+        except CacheUnavailable:
+            return
+        logger.debug(f"Set {len(mapping)} key(s) in Redis (TTL={ttl}s)")
 
     @classmethod
     async def get(cls, key: str) -> Optional[Any]:
-        if cls._conn is None:
-            raise RuntimeError("Redis connection not initialized")
+        entry = await cls.get_entry(key)
+        return entry.value if entry else None
+
+    @classmethod
+    async def get_entry(cls, key: str, local: bool = True) -> Optional[CacheEntry]:
+        if local:
+            entry = cls._local.get(key)
+            if entry is not None:
+                Metrics.incr("cache", "local_hits")
+                return entry
+            Metrics.incr("cache", "local_misses")
+
         try:
-            result = await cls._conn.get(key)
-            if not result:
-                return None
-            return json.loads(result)
-        except Exception as e:
-            logger.error(f"Failed to get key '{key}' from Redis: {e}")
-            raise
+            result = await cls._call("get", key)
+        except CacheUnavailable:
+            return None
+        return cls._load(key, result)
+
+    @classmethod
+    def _load(cls, key: str, result: Optional[bytes]) -> Optional[CacheEntry]:
+        if not result:
+            Metrics.incr("cache", "redis_misses")
+            return None
+        try:
+            frame = decompress_frame(result)
+            entry = loads_entry(frame)
+        except (ValueError, struct.error, zlib.error) as e:
+            # Written by an older release or another codec build; the next set replaces it
+            logger.warning(f"Discarding unreadable cache entry '{key}': {e}")
+            Metrics.incr("cache", "redis_misses")
+            return None
+        Metrics.incr("cache", "redis_hits")
+        cls._local.set(key, entry, len(frame))
+        return entry
+
+    @classmethod
+    async def get_many(cls, keys: Iterable[str]) -> Dict[str, Any]:
+        """Values of the keys that are cached, read with a single MGET for whatever the local tier lacks."""
+        found, remote = {}, []
+        for key in dict.fromkeys(keys):
+            entry = cls._local.get(key)
+            if entry is not None:
+                Metrics.incr("cache", "local_hits")
+                found[key] = entry.value
+            else:
+                Metrics.incr("cache", "local_misses")
+                remote.append(key)
+        if not remote:
+            return found
+
+        try:
+            results = await cls._call("mget", remote)
+        except CacheUnavailable:
+            return found
+        for key, result in zip(remote, results):
+            entry = cls._load(key, result)
+            if entry is not None:
+                found[key] = entry.value
+        return found
+
+    @classmethod
+    async def delete_many(cls, keys: Iterable[str]) -> int:
+        """Delete keys everywhere, including other workers' local tiers. Returns how many Redis held."""
+        keys = list(keys)
+        if not keys:
+            return 0
+
+        cls._local.delete(*keys)
+        try:
+            deleted = await cls._call("delete", *keys)
+            await cls._call("publish", INVALIDATION_CHANNEL, orjson.dumps(keys))
+        except CacheUnavailable:
+            return 0
+        return deleted
+
+    @classmethod
+    async def invalidate(cls, *tags: str) -> int:
+        """Delete every key registered under the given tags. Returns the number of keys removed."""
+        if not tags:
+            return 0
+
+        tag_keys = [f"{TAG_PREFIX}{tag}" for tag in tags]
+        try:
+            pipe = cls._pipeline()
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await cls._execute(pipe)
+            keys = {member.decode() for member in set().union(*members)}
+            cls._local.delete(*keys)
+            await cls._call("delete", *keys, *tag_keys)
+            if keys:
+                await cls._call("publish", INVALIDATION_CHANNEL, orjson.dumps(list(keys)))
+        except CacheUnavailable:
+            # Which keys the tags cover is only known to Redis: drop this worker's copies
+            # now and replay the tags as soon as Redis answers again
+            cls._missed_tags.update(tags)
+            cls._local.clear()
+            return 0
+        logger.debug(f"Invalidated {len(keys)} key(s) for tags {list(tags)}")
+        return len(keys)
+
+    @classmethod
+    def _replay_invalidations(cls):
+        tags, cls._missed_tags = cls._missed_tags, set()
+        logger.info(f"Replaying {len(tags)} cache invalidation(s) missed during the outage")
+        task = asyncio.create_task(cls.invalidate(*tags))
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def invalidate_object(cls, resource: str, *identifiers: Any) -> int:
+        """Invalidate the listings of a resource (`<resource>:*`) and the entries of the given ids/slugs."""
+        tags = [f"{resource}:*"]
+        tags.extend(f"{resource}:{identifier}" for identifier in identifiers if identifier)
+        return await cls.invalidate(*tags)
 
     @classmethod
     async def cache_or_fetch(
@@ -102,20 +503,300 @@ class CachingService:
         key: str,
         fetch_func: Callable[[], Coroutine[Any, Any, Any]],
         ttl: int = 3600,
+        tags: Optional[Iterable[str]] = None,
+        stale_ttl: int = 0,
     ) -> Any:
-        cached = await cls.get(key)
+        """
+        Return the cached value for `key`, fetching and storing it on a miss.
+
+        With `stale_ttl`, an entry older than `ttl` is still served for up to `stale_ttl`
+        more seconds while a single background task refreshes it.
+        """
+        cached = await cls.get_entry(key)
         if cached is not None:
             logger.info(f"Cache hit for key '{key}'")
-            return cached
+            if cached.fresh_until and cached.fresh_until <= time.time():
+                Metrics.incr("cache", "stale_hits")
+                cls._revalidate(key, fetch_func, ttl, tags, stale_ttl)
+            return cached.value
+
+        # Concurrent misses in this worker share one fetch. The fetch runs as its own
+        # task so a disconnecting client does not cancel it for everybody else.
+        task = cls._inflight.get(key)
+        if task is None:
+            logger.info(f"Cache miss for key '{key}', fetching data...")
+            task = asyncio.create_task(cls._fetch_and_store(key, fetch_func, ttl, tags, stale_ttl))
+            cls._track(cls._inflight, key, task)
+        else:
+            Metrics.incr("cache", "coalesced")
+        return await asyncio.shield(task)
+
+    @classmethod
+    async def cache_or_fetch_many(
+        cls,
+        resource: str,
+        ids: Iterable[Any],
+        fetch_func: Callable[[List[str]], Coroutine[Any, Any, Dict[str, Any]]],
+        ttl: int = 3600,
+    ) -> Dict[str, Any]:
+        """
+        Per-id values of a resource in the order of `ids`, for hydrating lists of objects.
+
+        Cached ids cost one MGET; the rest are passed to `fetch_func` in a single call,
+        which should load them with one `id__in` query and return `{id: value}` of plain,
+        serializable data. Ids it doesn't return are left out. Each id is tagged
+        `<resource>:<id>`, so `invalidate_object(resource, id)` clears it.
+        """
+        ids = list(dict.fromkeys(str(id) for id in ids))
+        keys = {id: f"obj:{resource}:{id}" for id in ids}
+        cached = await cls.get_many(keys.values())
+        missing = [id for id in ids if keys[id] not in cached]
+
+        fetched = {}
+        if missing:
+            Metrics.incr("cache", "fetches")
+            fetched = {str(id): value for id, value in (await fetch_func(missing)).items()}
+            await cls.set_many(
+                {keys[id]: value for id, value in fetched.items() if id in keys},
+                ttl,
+                tags=lambda key: [f"{resource}:{key.rsplit(':', 1)[1]}"],
+            )
 
-        logger.info(f"Cache miss for key '{key}', fetching data...")
-        data = await fetch_func()
-        await cls.set(key, data, ttl)
-        return data
+        results = {}
+        for id in ids:
+            if keys[id] in cached:
+                results[id] = cached[keys[id]]
+            elif id in fetched:
+                results[id] = fetched[id]
+        return results
+
+    @classmethod
+    def _revalidate(cls, key: str, fetch_func, ttl: int, tags: Optional[Iterable[str]], stale_ttl: int):
+        if key in cls._revalidating:
+            return
+        task = asyncio.create_task(
+            cls._fetch_and_store(key, fetch_func, ttl, tags, stale_ttl, wait=False)
+        )
+        cls._track(cls._revalidating, key, task)
 
+    @classmethod
+    def _track(cls, tasks: Dict[str, asyncio.Task], key: str, task: asyncio.Task):
+        def release(done: asyncio.Task):
+            if tasks.get(key) is done:
+                del tasks[key]
+            error = None if done.cancelled() else done.exception()
+            # HTTP errors (404s and the like) are answers, not failures
+            if error and not isinstance(error, HTTPException):
+                logger.warning(f"Fetching key '{key}' failed: {error}")
+
+        tasks[key] = task
+        task.add_done_callback(release)
+
+    @classmethod
+    async def _fetch_and_store(
+        cls,
+        key: str,
+        fetch_func: Callable[[], Coroutine[Any, Any, Any]],
+        ttl: int,
+        tags: Optional[Iterable[str]],
+        stale_ttl: int = 0,
+        wait: bool = True,
+        lock_timeout: int = CACHE_LOCK_TIMEOUT,
+    ) -> Any:
+        """
+        Recompute `key` while holding a short Redis lock so only one worker hits the database.
+        Without `wait`, give up when another worker already holds the lock.
+        """
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = await cls._call("set", lock_key, token, nx=True, ex=lock_timeout)
+        except CacheUnavailable:
+            # Nobody to coordinate with; this worker just fetches
+            acquired, token = True, None
+        if not acquired:
+            if not wait:
+                return None
+            Metrics.incr("cache", "lock_waits")
+            deadline = time.monotonic() + lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(LOCK_POLL_INTERVAL)
+                cached = await cls.get(key)
+                if cached is not None:
+                    return cached
+                try:
+                    if not await cls._call("exists", lock_key):
+                        break
+                except CacheUnavailable:
+                    break
+            # The holder failed or timed out; recompute without the lock
+            token = None
+        elif token and not wait:
+            # Our local copy may be older than what another worker already refreshed
+            current = await cls.get_entry(key, local=False)
+            if current and current.fresh_until and current.fresh_until > time.time():
+                await cls._release_lock(lock_key, token)
+                return current.value
 
-def cache(ttl: int = 60):
-    """Decorator for caching FastAPI endpoints."""
+        try:
+            Metrics.incr("cache", "fetches")
+            data = await fetch_func()
+            if stale_ttl:
+                await cls.set(key, data, ttl + stale_ttl, tags=tags, fresh_until=time.time() + ttl)
+            else:
+                await cls.set(key, data, ttl, tags=tags)
+            return data
+        finally:
+            if token:
+                await cls._release_lock(lock_key, token)
+
+    @classmethod
+    async def _release_lock(cls, lock_key: str, token: str):
+        try:
+            await cls._call("eval", RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except CacheUnavailable:
+            pass  # it expires on its own
+
+
+Metrics.register("cache", CachingService._local.stats)
+Metrics.register("cache", CachingService._breaker.stats)
+
+
+# Resolvers for `cache(vary_on=[...])`; auth-aware ones are registered by the permission layer
+VARY_RESOLVERS: Dict[str, Callable[[Request], Awaitable[str]]] = {}
+
+
+def vary_resolver(name: str):
+    """Register `async def resolver(request) -> str` under `name` for use in `cache(vary_on=...)`."""
+    def decorator(func):
+        VARY_RESOLVERS[name] = func
+        return func
+    return decorator
+
+
+KEY_SCALARS = (str, int, float, bool, uuid.UUID, datetime.date, enum.Enum)
+
+
+def _key_value(value: Any) -> str:
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def cache_key(request: Request, params: Dict[str, Any]) -> str:
+    """
+    Key for an endpoint call, built from its resolved parameters rather than the raw URL:
+    query order, omitted defaults and undeclared extras (cache busters) all map to the
+    same entry. Injected objects (request, user, body models, ...) are left out.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or request.url.path
+    pairs = []
+    for name, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)) and all(isinstance(item, KEY_SCALARS) for item in value):
+            pairs.extend((name, _key_value(item)) for item in value)
+        elif isinstance(value, KEY_SCALARS):
+            pairs.append((name, _key_value(value)))
+    key = f"cache:{path}?{urlencode(pairs)}"
+    if len(key) > CACHE_MAX_KEY_LENGTH:
+        # Keep the route readable for SCAN/debugging, hash the rest to a fixed length
+        key = f"cache:{path}#{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"
+    return key
+
+
+async def _vary_suffix(request: Request, vary_on: List[str]) -> str:
+    parts = []
+    for name in vary_on:
+        if name.startswith("header:"):
+            value = request.headers.get(name.removeprefix("header:"), "")
+        elif name in VARY_RESOLVERS:
+            value = await VARY_RESOLVERS[name](request)
+        else:
+            raise ValueError(f"Unknown cache vary_on value '{name}'")
+        parts.append(f"{name}={value}")
+    # Hashed so user ids and header values don't end up readable in key names
+    return hashlib.blake2b("|".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _last_modified(value: Any) -> Optional[datetime.datetime]:
+    """
+    `updated_at` of a single-object response. Lists get none: removing an item never
+    raises their newest `updated_at`, so only the ETag can tell they changed.
+    """
+    if isinstance(value, Model):
+        return getattr(value, "updated_at", None)
+    if isinstance(value, dict) and isinstance(value.get("updated_at"), datetime.datetime):
+        return value["updated_at"]
+    return None
+
+
+def _conditional_headers(body: bytes, value: Any) -> Dict[str, str]:
+    headers = {
+        "ETag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        # Let browsers keep the body but check back on every use
+        "Cache-Control": "no-cache",
+    }
+    updated_at = _last_modified(value)
+    if updated_at is not None:
+        if updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=datetime.timezone.utc)
+        headers["Last-Modified"] = format_datetime(updated_at.astimezone(datetime.timezone.utc), usegmt=True)
+    return headers
+
+
+def _not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """Whether the client's copy of the representation described by `headers` is current."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or headers["ETag"] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "Last-Modified" in headers:
+        try:
+            return parsedate_to_datetime(headers["Last-Modified"]) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def cache(
+    ttl: int = 60,
+    tags: Optional[List[str]] = None,
+    stale_ttl: int = 0,
+    store_response: bool = True,
+    conditional: bool = False,
+    vary_on: Optional[List[str]] = None,
+    negative_ttl: int = 0,
+):
+    """
+    Decorator for caching FastAPI endpoints.
+
+    `tags` are the resources the response depends on, e.g. `["blog:*"]` for a listing or
+    `["blog:{slug_or_id}"]` for a detail route (placeholders are filled from the endpoint's
+    arguments). Writes clear them through `CachingService.invalidate`.
+
+    `stale_ttl` keeps serving the previous response for that many seconds after `ttl`
+    while it is refreshed in the background, so no request pays for the expiry.
+
+    With `store_response` (the default) the encoded JSON body is cached and replayed as-is,
+    together with its gzip (and brotli) encodings, so hits skip both serialization and
+    compression; otherwise the decoded data is returned.
+
+    `conditional` stores an ETag (and a Last-Modified taken from `updated_at`) with the
+    response and answers matching `If-None-Match` / `If-Modified-Since` with an empty 304.
+
+    `vary_on` keeps a separate entry per caller for endpoints whose result depends on who
+    is asking: `"user"` (the token's subject), `"permissions"` (a hash of the caller's
+    permission set) and `"header:<Name>"`.
+
+    `negative_ttl` caches 404s for that many seconds, so floods of unknown slugs/ids
+    don't each reach the database. They share the route's tags, so creating the
+    missing object clears them.
+    """
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -130,14 +811,43 @@ def cache(ttl: int = 60):
             if not request:
                 raise ValueError("Request object not found for caching")
 
-            key = f"cache:{request.url.path}?{request.url.query}"
-            cached = await CachingService.get(key)
-            if cached:
-                return cached
+            key = cache_key(request, kwargs)
+            if vary_on:
+                key = f"{key}#{await _vary_suffix(request, vary_on)}"
+            key_tags = [tag.format(**kwargs) for tag in tags or ()]
+
+            async def fetch():
+                value = await func(*args, **kwargs)
+                body = dumps_json(value)
+                if not store_response:
+                    return orjson.loads(body)
+                headers = _conditional_headers(body, value) if conditional else {}
+                return CachedResponse(body=body, headers=headers, encodings=precompress(body))
 
-            result = await func(*args, **kwargs)
-            await CachingService.set(key, result, ttl)
-            return result
+            try:
+                result = await CachingService.cache_or_fetch(
+                    key, fetch, ttl, tags=key_tags, stale_ttl=stale_ttl
+                )
+            except HTTPException as e:
+                if not negative_ttl or e.status_code != 404:
+                    raise
+                result = CachedResponse(
+                    body=dumps_json({"detail": e.detail}),
+                    headers=dict(e.headers or {}),
+                    status_code=e.status_code,
+                )
+                await CachingService.set(key, result, negative_ttl, tags=key_tags)
+                Metrics.incr("cache", "negative_stores")
+            if not isinstance(result, CachedResponse):
+                return result
+            accept_encoding = request.headers.get("accept-encoding", "")
+            if "ETag" in result.headers:
+                headers = result.representation_headers(result.select_encoding(accept_encoding))
+                if _not_modified(request, headers):
+                    Metrics.incr("cache", "not_modified")
+                    headers.pop("Content-Encoding", None)
+                    return Response(status_code=304, headers=headers)
+            return result.to_response(accept_encoding)
 
         return wrapper
     return decorator
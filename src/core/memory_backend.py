@@ -0,0 +1,178 @@
+# src/core/memory_backend.py
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
+
+Key = Union[str, bytes]
+
+
+def _b(value: Any) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode()
+
+
+class MemoryRedis:
+    """
+    In-process stand-in for the subset of `redis.asyncio.Redis` the cache layer uses,
+    for local runs and tests without a Redis server. Single process only: there is
+    no pub/sub, so other workers never hear about invalidations.
+
+    Lua scripts can't run here; code that `eval`s a script registers a Python
+    equivalent with `MemoryRedis.register_script(script, func)`.
+    """
+    scripts: Dict[str, Callable[..., Any]] = {}
+
+    def __init__(self):
+        self._data: Dict[bytes, Any] = {}
+        self._expires: Dict[bytes, float] = {}
+
+    @classmethod
+    def register_script(cls, script: str, func: Callable[..., Any]):
+        """`func(backend, keys, args)` runs in place of `script` on `eval`."""
+        cls.scripts[script] = func
+
+    def _alive(self, key: Key) -> Optional[bytes]:
+        key = _b(key)
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key if key in self._data else None
+
+    def _ttl(self, key: bytes) -> float:
+        expires_at = self._expires.get(key)
+        return -1 if expires_at is None else expires_at - time.time()
+
+    async def ping(self) -> bool:
+        return True
+
+    async def close(self):
+        self._data.clear()
+        self._expires.clear()
+
+    def pipeline(self, transaction: bool = False) -> "MemoryPipeline":
+        return MemoryPipeline(self)
+
+    async def get(self, key: Key) -> Optional[bytes]:
+        key = self._alive(key)
+        return self._data[key] if key is not None else None
+
+    async def mget(self, keys: List[Key]) -> List[Optional[bytes]]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: Key, value: Any, ex: Optional[int] = None, nx: bool = False) -> Optional[bool]:
+        if nx and self._alive(key) is not None:
+            return None
+        key = _b(key)
+        self._data[key] = _b(value)
+        if ex:
+            self._expires[key] = time.time() + ex
+        else:
+            self._expires.pop(key, None)
+        return True
+
+    async def delete(self, *keys: Key) -> int:
+        deleted = 0
+        for key in keys:
+            key = self._alive(key)
+            if key is not None:
+                del self._data[key]
+                self._expires.pop(key, None)
+                deleted += 1
+        return deleted
+
+    async def exists(self, *keys: Key) -> int:
+        return sum(self._alive(key) is not None for key in keys)
+
+    async def expire(self, key: Key, seconds: int, nx: bool = False, gt: bool = False) -> bool:
+        key = self._alive(key)
+        if key is None:
+            return False
+        ttl = self._ttl(key)
+        if nx and ttl != -1:
+            return False
+        if gt and (ttl == -1 or seconds <= ttl):
+            return False
+        self._expires[key] = time.time() + seconds
+        return True
+
+    async def incr(self, key: Key) -> int:
+        alive = self._alive(key)
+        value = int(self._data[alive]) + 1 if alive is not None else 1
+        self._data[_b(key)] = _b(value)
+        return value
+
+    async def pttl(self, key: Key) -> int:
+        key = self._alive(key)
+        if key is None:
+            return -2
+        ttl = self._ttl(key)
+        return -1 if ttl == -1 else int(ttl * 1000)
+
+    async def sadd(self, key: Key, *members: Any) -> int:
+        key = self._alive(key) or _b(key)
+        current: Set[bytes] = self._data.setdefault(key, set())
+        added = {_b(member) for member in members} - current
+        current |= added
+        return len(added)
+
+    async def smembers(self, key: Key) -> Set[bytes]:
+        key = self._alive(key)
+        return set(self._data[key]) if key is not None else set()
+
+    async def zadd(self, key: Key, mapping: Dict[Any, float]) -> int:
+        key = self._alive(key) or _b(key)
+        current: Dict[bytes, float] = self._data.setdefault(key, {})
+        added = sum(_b(member) not in current for member in mapping)
+        current.update({_b(member): float(score) for member, score in mapping.items()})
+        return added
+
+    async def zrangebyscore(self, key: Key, min: Any, max: Any) -> List[bytes]:
+        key = self._alive(key)
+        if key is None:
+            return []
+        low, high = float(min), float(max)
+        return [member for member, score in sorted(self._data[key].items(), key=lambda item: item[1]) if low <= score <= high]
+
+    async def zremrangebyscore(self, key: Key, min: Any, max: Any) -> int:
+        key = self._alive(key)
+        if key is None:
+            return 0
+        low, high = float(min), float(max)
+        members = self._data[key]
+        removed = [member for member, score in members.items() if low <= score <= high]
+        for member in removed:
+            del members[member]
+        return len(removed)
+
+    async def publish(self, channel: str, message: Any) -> int:
+        return 0
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        func = self.scripts.get(script)
+        if func is None:
+            raise NotImplementedError("Script has no in-memory equivalent registered")
+        return await func(self, list(keys_and_args[:numkeys]), list(keys_and_args[numkeys:]))
+
+
+class MemoryPipeline:
+    def __init__(self, backend: MemoryRedis):
+        self._backend = backend
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if not callable(getattr(self._backend, name, None)):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        return [await getattr(self._backend, name)(*args, **kwargs) for name, args, kwargs in commands]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self._commands = []
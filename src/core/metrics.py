@@ -0,0 +1,33 @@
+# src/core/metrics.py
+from collections import defaultdict
+from typing import Any, Callable, Dict, List
+
+
+class Metrics:
+    """
+    Per-worker counters. Every uvicorn worker keeps its own numbers, so a
+    snapshot describes the worker that served the request.
+    """
+    _counters: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(int))
+    _collectors: Dict[str, List[Callable[[], Dict[str, Any]]]] = defaultdict(list)
+
+    @classmethod
+    def incr(cls, group: str, name: str, value: float = 1):
+        cls._counters[group][name] += value
+
+    @classmethod
+    def register(cls, group: str, collector: Callable[[], Dict[str, Any]]):
+        """Attach a callable whose values are merged into the group on every snapshot."""
+        cls._collectors[group].append(collector)
+
+    @classmethod
+    def snapshot(cls) -> Dict[str, Dict[str, Any]]:
+        data = {group: dict(values) for group, values in cls._counters.items()}
+        for group, collectors in cls._collectors.items():
+            for collector in collectors:
+                data.setdefault(group, {}).update(collector())
+        return data
+
+    @classmethod
+    def reset(cls):
+        cls._counters.clear()
@@ -0,0 +1,224 @@
+# src/core/ratelimit.py
+import hashlib
+import math
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import orjson
+from fastapi import HTTPException
+from src.core.cache import CacheUnavailable, CachingService
+from src.core.memory_backend import MemoryRedis
+from src.core.metrics import Metrics
+from src.config.env import (
+    LOGIN_LIMIT_WINDOW,
+    LOGIN_LIMIT_PER_IP,
+    LOGIN_LIMIT_PER_EMAIL,
+    LOGIN_BLOCK_BASE,
+    LOGIN_BLOCK_MAX,
+)
+
+# Sliding-window log with progressive blocking, in one round trip.
+# KEYS: window zset, block key, strike counter
+# ARGV: now (ms), window (ms), limit, base block (ms), max block (ms), unique member
+# Returns {allowed, retry_after_ms}
+SLIDING_WINDOW_SCRIPT = """
+local blocked = redis.call("pttl", KEYS[2])
+if blocked > 0 then
+    return {0, blocked}
+end
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call("zremrangebyscore", KEYS[1], "-inf", now - window)
+if redis.call("zcard", KEYS[1]) < tonumber(ARGV[3]) then
+    redis.call("zadd", KEYS[1], now, ARGV[6])
+    redis.call("pexpire", KEYS[1], window)
+    return {1, 0}
+end
+local strikes = redis.call("incr", KEYS[3])
+local block = math.floor(math.min(tonumber(ARGV[4]) * 2 ^ (strikes - 1), tonumber(ARGV[5])))
+redis.call("pexpire", KEYS[3], tonumber(ARGV[5]) * 2)
+redis.call("set", KEYS[2], 1, "px", block)
+return {0, block}
+"""
+
+
+async def _sliding_window_in_memory(backend: MemoryRedis, keys: List[str], args: List) -> List[int]:
+    window_key, block_key, strikes_key = keys
+    now, window, limit, base, longest = (float(arg) for arg in args[:5])
+    blocked = await backend.pttl(block_key)
+    if blocked > 0:
+        return [0, blocked]
+    await backend.zremrangebyscore(window_key, "-inf", now - window)
+    if len(await backend.zrangebyscore(window_key, "-inf", "+inf")) < limit:
+        await backend.zadd(window_key, {args[5]: now})
+        await backend.expire(window_key, max(1, int(window / 1000)))
+        return [1, 0]
+    strikes = await backend.incr(strikes_key)
+    block = int(min(base * 2 ** (strikes - 1), longest))
+    await backend.expire(strikes_key, int(longest / 1000) * 2)
+    await backend.set(block_key, b"1", ex=max(1, block // 1000))
+    return [0, block]
+
+
+MemoryRedis.register_script(SLIDING_WINDOW_SCRIPT, _sliding_window_in_memory)
+
+
+class LoginThrottle:
+    """
+    Caps login attempts per client IP and per account before any password is hashed.
+
+    Each scope allows `limit` attempts per sliding `LOGIN_LIMIT_WINDOW`. Going over
+    blocks the scope for `LOGIN_BLOCK_BASE` seconds, doubling on every repeat up to
+    `LOGIN_BLOCK_MAX`. If Redis is unavailable, logins are let through.
+    """
+
+    @staticmethod
+    def _keys(scope: str, value: str) -> Tuple[str, str, str]:
+        digest = hashlib.blake2b(value.lower().encode(), digest_size=12).hexdigest()
+        base = f"ratelimit:login:{scope}:{digest}"
+        return f"{base}:window", f"{base}:block", f"{base}:strikes"
+
+    @classmethod
+    async def _hit(cls, scope: str, value: str, limit: int) -> int:
+        """Record an attempt; returns 0 if allowed, else the milliseconds until the next one may be."""
+        allowed, retry_after = await CachingService._call(
+            "eval", SLIDING_WINDOW_SCRIPT, 3, *cls._keys(scope, value),
+            int(time.time() * 1000), LOGIN_LIMIT_WINDOW * 1000, limit,
+            LOGIN_BLOCK_BASE * 1000, LOGIN_BLOCK_MAX * 1000, uuid.uuid4().hex,
+        )
+        return 0 if int(allowed) else int(retry_after)
+
+    @classmethod
+    async def check(cls, ip_address: str, email: str):
+        """Raise 429 if either the IP or the account is over its limit."""
+        try:
+            retry_after = await cls._hit("ip", ip_address, LOGIN_LIMIT_PER_IP)
+            if not retry_after:
+                retry_after = await cls._hit("email", email, LOGIN_LIMIT_PER_EMAIL)
+        except CacheUnavailable:
+            Metrics.incr("ratelimit", "login_unchecked")
+            return
+        if retry_after:
+            Metrics.incr("ratelimit", "login_rejected")
+            seconds = -(-retry_after // 1000)
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts, try again later",
+                headers={"Retry-After": str(seconds)},
+            )
+        Metrics.incr("ratelimit", "login_accepted")
+
+    @classmethod
+    async def reset(cls, email: str):
+        """Forget an account's attempts after a successful login."""
+        try:
+            await CachingService._call("delete", *cls._keys("email", email))
+        except CacheUnavailable:
+            pass
+
+
+# Token buckets, all-or-nothing: a request takes one token from every bucket or from none.
+# KEYS: one hash per bucket
+# ARGV: now (ms), then per bucket: refill rate (tokens per ms), capacity
+# Returns the milliseconds until every bucket has a token again (0 = allowed)
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local rate, capacity = tonumber(ARGV[i * 2]), tonumber(ARGV[i * 2 + 1])
+    local bucket = redis.call("hmget", key, "tokens", "ts")
+    local available = tonumber(bucket[1]) or capacity
+    local elapsed = math.max(0, now - (tonumber(bucket[2]) or now))
+    available = math.min(capacity, available + elapsed * rate)
+    if available < 1 then
+        wait = math.max(wait, math.ceil((1 - available) / rate))
+    end
+    tokens[i] = available
+end
+for i, key in ipairs(KEYS) do
+    local rate, capacity = tonumber(ARGV[i * 2]), tonumber(ARGV[i * 2 + 1])
+    local available = tokens[i]
+    if wait == 0 then
+        available = available - 1
+    end
+    redis.call("hset", key, "tokens", available, "ts", now)
+    redis.call("pexpire", key, math.ceil(capacity / rate))
+end
+return wait
+"""
+
+
+async def _token_bucket_in_memory(backend: MemoryRedis, keys: List[str], args: List) -> int:
+    now, wait, tokens = float(args[0]), 0, []
+    for i, key in enumerate(keys):
+        rate, capacity = float(args[i * 2 + 1]), float(args[i * 2 + 2])
+        stored = await backend.get(key)
+        available, last = orjson.loads(stored) if stored else (capacity, now)
+        available = min(capacity, available + max(0.0, now - last) * rate)
+        if available < 1:
+            wait = max(wait, math.ceil((1 - available) / rate))
+        tokens.append(available)
+    for i, key in enumerate(keys):
+        rate, capacity = float(args[i * 2 + 1]), float(args[i * 2 + 2])
+        available = tokens[i] - (0 if wait else 1)
+        await backend.set(key, orjson.dumps([available, now]), ex=max(1, math.ceil(capacity / rate / 1000)))
+    return wait
+
+
+MemoryRedis.register_script(TOKEN_BUCKET_SCRIPT, _token_bucket_in_memory)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Token-bucket policy for a router. Each client IP may burst `burst` requests and
+    then `per_minute` a minute; `route_per_minute` optionally caps all clients together.
+    Only requests whose method is in `methods` count, and none to the `exempt` paths
+    (relative to the prefix), e.g. a logout that must work for a throttled client.
+    """
+    per_minute: float
+    burst: int
+    route_per_minute: Optional[float] = None
+    route_burst: Optional[int] = None
+    methods: Tuple[str, ...] = ("POST", "PUT", "PATCH", "DELETE")
+    exempt: Tuple[str, ...] = ()
+
+
+class RateLimiter:
+    """Token buckets per router prefix, checked by `RateLimitMiddleware` before routing."""
+    policies: Dict[str, RateLimit] = {}
+
+    @classmethod
+    def register(cls, prefix: str, policy: RateLimit):
+        cls.policies[prefix.rstrip("/")] = policy
+
+    @classmethod
+    def match(cls, path: str, method: str) -> Optional[Tuple[str, RateLimit]]:
+        for prefix, policy in cls.policies.items():
+            if (path == prefix or path.startswith(prefix + "/")) and method in policy.methods:
+                if path[len(prefix):].rstrip("/") in policy.exempt:
+                    return None
+                return prefix, policy
+        return None
+
+    @classmethod
+    async def hit(cls, prefix: str, method: str, ip_address: str, policy: RateLimit) -> float:
+        """Take a token for this request; returns 0 if allowed, else seconds until it would be."""
+        base = f"ratelimit:route:{method}:{prefix}"
+        args = [int(time.time() * 1000), policy.per_minute / 60_000, policy.burst]
+        keys = [f"{base}:{ip_address}"]
+        if policy.route_per_minute:
+            keys.append(base)
+            args += [policy.route_per_minute / 60_000, policy.route_burst or policy.route_per_minute]
+        try:
+            wait = await CachingService._call("eval", TOKEN_BUCKET_SCRIPT, len(keys), *keys, *args)
+        except CacheUnavailable:
+            Metrics.incr("ratelimit", "requests_unchecked")
+            return 0
+        if wait:
+            Metrics.incr("ratelimit", "requests_throttled")
+            return int(wait) / 1000
+        Metrics.incr("ratelimit", "requests_allowed")
+        return 0
@@ -0,0 +1,149 @@
+# src/core/revocation.py
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Iterable, List, Optional
+from src.core.cache import CacheUnavailable, CachingService
+from src.core.metrics import Metrics
+from src.config.env import AUTH_REVOCATION_BLOOM_BITS, AUTH_REVOCATION_BLOOM_HASHES, AUTH_REVOCATION_REBUILD_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+REVOKED_PREFIX = "revoked:"
+REVOKED_INDEX = "revoked:index"  # sorted set of jti -> expiry, to rebuild filters from
+REVOCATION_CHANNEL = "auth:revoked"
+REBUILD_RETRY = 30  # seconds between rebuild attempts while Redis is unreachable
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter: no false negatives, a small rate of false positives."""
+
+    def __init__(self, bits: int = AUTH_REVOCATION_BLOOM_BITS, hashes: int = AUTH_REVOCATION_BLOOM_HASHES):
+        self.bits = bits
+        self.hashes = hashes
+        self.count = 0
+        self._array = bytearray((bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.bits for i in range(self.hashes))
+
+    @property
+    def capacity(self) -> int:
+        """Entries the filter holds at its design false-positive rate."""
+        return int(self.bits * math.log(2) / self.hashes)
+
+    @classmethod
+    def sized_for(cls, entries: int) -> "BloomFilter":
+        """A filter with room for twice `entries`, and never smaller than the configured size."""
+        bits = math.ceil(2 * entries * AUTH_REVOCATION_BLOOM_HASHES / math.log(2))
+        return cls(bits=max(AUTH_REVOCATION_BLOOM_BITS, bits))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenDenylist:
+    """
+    Revoked token ids (`jti`), kept in Redis until the token would have expired anyway.
+
+    Each worker holds a Bloom filter of every revoked jti, kept current over pub/sub,
+    so a token that was never revoked (nearly all of them) is accepted without a
+    network call. Only filter hits are confirmed against Redis.
+
+    A filter only grows, and its false-positive rate with it, so it is rebuilt from
+    the live revocations every `AUTH_REVOCATION_REBUILD_INTERVAL` seconds, or sooner
+    once it holds more than its capacity.
+    """
+    _filter = BloomFilter()
+    _rebuild_due = time.monotonic() + AUTH_REVOCATION_REBUILD_INTERVAL
+    _retry_at = 0.0
+    _rebuilding: Optional[asyncio.Task] = None
+    _journal: Optional[List[str]] = None  # jtis added while any rebuild reads Redis
+    _readers = 0
+
+    @classmethod
+    def _remember(cls, jti: str):
+        cls._filter.add(jti)
+        if cls._journal is not None:
+            cls._journal.append(jti)
+
+    @classmethod
+    def _maybe_rebuild(cls):
+        now = time.monotonic()
+        if now < cls._retry_at or (cls._rebuilding and not cls._rebuilding.done()):
+            return
+        if now < cls._rebuild_due and cls._filter.count <= cls._filter.capacity:
+            return
+        cls._retry_at = now + REBUILD_RETRY
+        cls._rebuilding = asyncio.create_task(cls.resync())
+
+    @classmethod
+    async def revoke(cls, jti: str, expires_at: float):
+        """Deny `jti` until `expires_at`. Raises `CacheUnavailable` if Redis can't record it."""
+        ttl = int(expires_at - time.time()) + 1
+        if ttl <= 0:
+            return
+        cls._remember(jti)
+        cls._maybe_rebuild()
+        pipe = CachingService._pipeline()
+        pipe.set(f"{REVOKED_PREFIX}{jti}", b"1", ex=ttl)
+        pipe.zadd(REVOKED_INDEX, {jti: expires_at})
+        await CachingService._execute(pipe)
+        await CachingService.publish(REVOCATION_CHANNEL, jti.encode())
+        Metrics.incr("auth", "revoked")
+
+    @classmethod
+    async def is_revoked(cls, jti: Optional[str]) -> bool:
+        cls._maybe_rebuild()
+        if not jti or jti not in cls._filter:
+            return False
+        Metrics.incr("auth", "revocation_lookups")
+        try:
+            return bool(await CachingService._call("exists", f"{REVOKED_PREFIX}{jti}"))
+        except CacheUnavailable:
+            # Filter hits are almost always real revocations; fail closed
+            return True
+
+    @classmethod
+    async def resync(cls):
+        """Rebuild this worker's filter from Redis, dropping jtis whose tokens have expired."""
+        # Revocations that land while Redis is read must survive the swap
+        cls._readers += 1
+        if cls._journal is None:
+            cls._journal = []
+        try:
+            now = time.time()
+            await CachingService._call("zremrangebyscore", REVOKED_INDEX, "-inf", now)
+            members = await CachingService._call("zrangebyscore", REVOKED_INDEX, now, "+inf")
+        except CacheUnavailable:
+            logger.warning("Could not reload revoked tokens; keeping the current filter")
+            return
+        finally:
+            journal = cls._journal
+            cls._readers -= 1
+            if not cls._readers:
+                cls._journal = None
+        rebuilt = BloomFilter.sized_for(len(members) + len(journal))
+        for jti in [member.decode() for member in members] + journal:
+            rebuilt.add(jti)
+        cls._filter = rebuilt
+        cls._rebuild_due = time.monotonic() + AUTH_REVOCATION_REBUILD_INTERVAL
+        Metrics.incr("auth", "revocation_rebuilds")
+        logger.info(f"Loaded {rebuilt.count} revoked token(s)")
+
+    @classmethod
+    def stats(cls) -> dict:
+        return {"revocation_filter_entries": cls._filter.count, "revocation_filter_capacity": cls._filter.capacity}
+
+
+CachingService.subscribe(REVOCATION_CHANNEL, lambda data: TokenDenylist._remember(data.decode()), TokenDenylist.resync)
+Metrics.register("auth", TokenDenylist.stats)
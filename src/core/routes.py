@@ -8,6 +8,7 @@ from src.apps.public.blog.routes import category_router, blogs_router
 from src.apps.public.event.routes import event_router
 from src.apps.public.faq.routes import faq_router
 from src.apps.public.gallery.routes import gallery_router
+from src.apps.metrics.routes import metrics_router
 
 routes = [
     user_route,
@@ -24,5 +25,6 @@ routes = [
     contact_router,
     team_router,
     social_router,
-    branch_router
+    branch_router,
+    metrics_router,
 ]
\ No newline at end of file
@@ -0,0 +1,345 @@
+# src/core/serializers.py
+import datetime
+import decimal
+import enum
+import gzip
+import logging
+import struct
+import time
+import uuid
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+import orjson
+from starlette.responses import Response
+from tortoise.models import Model
+from tortoise.fields.relational import ManyToManyRelation, ReverseRelation
+from src.core.metrics import Metrics
+from src.config.env import CACHE_CODEC, CACHE_COMPRESSION, CACHE_COMPRESS_MIN_BYTES, CACHE_PRECOMPRESS_MIN_BYTES
+
+try:
+    import msgpack
+except ImportError:  # optional: pip install msgpack
+    msgpack = None
+
+try:
+    import lz4.frame as lz4
+except ImportError:  # optional: pip install lz4
+    lz4 = None
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Never leave the process, even if a model instance is returned as-is
+HIDDEN_FIELDS = {"password"}
+
+
+def model_to_dict(obj: Model) -> Dict[str, Any]:
+    """Plain dict of a model's fields plus the relations that were fetched along with it."""
+    meta = obj._meta
+    data = {}
+    for name in meta.fields_map:
+        if name in HIDDEN_FIELDS:
+            continue
+        if name not in meta.fetch_fields:
+            data[name] = getattr(obj, name)
+            continue
+        # Related objects live under `_<name>` once select_related/prefetch_related loaded them
+        cached_name = f"_{name}"
+        if cached_name not in obj.__dict__:
+            continue
+        related = obj.__dict__[cached_name]
+        if isinstance(related, (ManyToManyRelation, ReverseRelation)):
+            if related._fetched:
+                data[name] = list(related.related_objects)
+        elif related is None or isinstance(related, Model):
+            data[name] = related
+    return data
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Model):
+        return model_to_dict(obj)
+    if isinstance(obj, (ManyToManyRelation, ReverseRelation)):
+        return list(obj.related_objects) if obj._fetched else []
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not serializable: {type(obj).__name__}")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    return _default(obj)
+
+
+def dumps_json(value: Any) -> bytes:
+    """Encode a handler's return value exactly as the API would send it."""
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class OrjsonCodec:
+    id = b"j"
+    name = "orjson"
+
+    def dumps(self, value: Any) -> bytes:
+        return dumps_json(value)
+
+    def loads(self, data) -> Any:
+        return orjson.loads(data)
+
+
+class MsgpackCodec:
+    id = b"m"
+    name = "msgpack"
+
+    def dumps(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+
+    def loads(self, data) -> Any:
+        return msgpack.unpackb(data, raw=False)
+
+
+CODECS = {codec.id: codec for codec in (OrjsonCodec(), MsgpackCodec()) if codec.name != "msgpack" or msgpack}
+
+
+def get_codec(name: str = CACHE_CODEC):
+    for codec in CODECS.values():
+        if codec.name == name:
+            return codec
+    logger.warning(f"Cache codec '{name}' is not available, falling back to orjson")
+    return CODECS[OrjsonCodec.id]
+
+
+# Preferred first when the client accepts several
+CONTENT_ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+
+def precompress(body: bytes, min_bytes: int = CACHE_PRECOMPRESS_MIN_BYTES) -> Dict[str, bytes]:
+    """Content-encoded copies of a response body, made once when it is cached."""
+    if len(body) < min_bytes:
+        return {}
+    encodings = {"gzip": gzip.compress(body, compresslevel=6, mtime=0)}
+    if brotli:
+        encodings["br"] = brotli.compress(body, quality=5)
+    return encodings
+
+
+def accepted_encodings(accept_encoding: str) -> set:
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        if quality > 0:
+            accepted.add(coding.strip())
+    return accepted
+
+
+@dataclass
+class CachedResponse:
+    """
+    An endpoint's final response body, replayed on cache hits without re-serializing.
+    `encodings` holds precompressed copies of the body, served to clients that accept them.
+    """
+    body: bytes
+    media_type: str = "application/json"
+    headers: Dict[str, str] = field(default_factory=dict)
+    status_code: int = 200
+    encodings: Dict[str, bytes] = field(default_factory=dict)
+
+    def select_encoding(self, accept_encoding: str = "") -> Optional[str]:
+        """The stored coding to serve to a client sending `accept_encoding`; None for identity."""
+        if self.encodings:
+            accepted = accepted_encodings(accept_encoding)
+            for coding in CONTENT_ENCODINGS:
+                if coding in self.encodings and (coding in accepted or "*" in accepted):
+                    return coding
+        return None
+
+    def representation_headers(self, coding: Optional[str]) -> Dict[str, str]:
+        """
+        Headers of one representation. Each coding is a different byte sequence, so it
+        gets its own strong ETag, the identity one suffixed with the coding.
+        """
+        headers = dict(self.headers)
+        if self.encodings:
+            # Identity and 304 replies too, or shared caches may hand them to the wrong clients
+            headers["Vary"] = "Accept-Encoding"
+        if coding:
+            headers["Content-Encoding"] = coding
+            if "ETag" in headers:
+                headers["ETag"] = f'{headers["ETag"][:-1]}-{coding}"'
+        return headers
+
+    def to_response(self, accept_encoding: str = "") -> Response:
+        coding = self.select_encoding(accept_encoding)
+        return Response(
+            # GZipMiddleware leaves responses that already carry an encoding alone
+            content=self.encodings[coding] if coding else self.body,
+            status_code=self.status_code,
+            media_type=self.media_type,
+            headers=self.representation_headers(coding),
+        )
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    fresh_until: Optional[float] = None  # set for stale-while-revalidate entries
+
+
+# Frame layout: codec id (1 byte) | fresh_until (float64, 0 when unset) | payload.
+# Stored frames are additionally prefixed with a compression id, see `compress_frame`.
+HEADER = struct.Struct(">cd")
+META_LENGTH = struct.Struct(">I")
+RESPONSE_ID = b"r"
+
+
+def dumps_entry(entry: CacheEntry, codec) -> bytes:
+    fresh_until = entry.fresh_until or 0.0
+    if isinstance(entry.value, CachedResponse):
+        response = entry.value
+        meta = orjson.dumps({
+            "media_type": response.media_type,
+            "headers": response.headers,
+            "status_code": response.status_code,
+            "body_length": len(response.body),
+            "encodings": [[coding, len(data)] for coding, data in response.encodings.items()],
+        })
+        return b"".join((
+            HEADER.pack(RESPONSE_ID, fresh_until),
+            META_LENGTH.pack(len(meta)),
+            meta,
+            response.body,
+            *response.encodings.values(),
+        ))
+    return HEADER.pack(codec.id, fresh_until) + codec.dumps(entry.value)
+
+
+def loads_entry(data: bytes) -> CacheEntry:
+    codec_id, fresh_until = HEADER.unpack_from(data)
+    payload = memoryview(data)[HEADER.size:]
+    if codec_id == RESPONSE_ID:
+        (meta_length,) = META_LENGTH.unpack_from(payload)
+        meta = orjson.loads(payload[META_LENGTH.size:META_LENGTH.size + meta_length])
+        offset = META_LENGTH.size + meta_length
+        # Response body first, then each precompressed copy
+        end = offset + meta["body_length"] if "body_length" in meta else len(payload)
+        body = bytes(payload[offset:end])
+        encodings = {}
+        for coding, length in meta.get("encodings", ()):
+            encodings[coding] = bytes(payload[end:end + length])
+            end += length
+        value = CachedResponse(
+            body=body,
+            media_type=meta["media_type"],
+            headers=meta["headers"],
+            status_code=meta.get("status_code", 200),
+            encodings=encodings,
+        )
+    else:
+        codec = CODECS.get(codec_id)
+        if codec is None:
+            raise ValueError(f"Unknown cache codec {codec_id!r}")
+        value = codec.loads(payload)
+    return CacheEntry(value=value, fresh_until=fresh_until or None)
+
+
+class NoCompression:
+    id = b"\x00"
+    name = "none"
+
+    def compress(self, data: bytes) -> bytes:
+        return data
+
+    def decompress(self, data) -> bytes:
+        return bytes(data)
+
+
+class ZlibCompression:
+    id = b"\x01"
+    name = "zlib"
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, 1)
+
+    def decompress(self, data) -> bytes:
+        return zlib.decompress(data)
+
+
+class Lz4Compression:
+    id = b"\x02"
+    name = "lz4"
+
+    def compress(self, data: bytes) -> bytes:
+        return lz4.compress(data)
+
+    def decompress(self, data) -> bytes:
+        return lz4.decompress(data)
+
+
+COMPRESSORS = {
+    compressor.id: compressor
+    for compressor in (NoCompression(), ZlibCompression(), Lz4Compression())
+    if compressor.name != "lz4" or lz4
+}
+
+
+def get_compressor(name: str = CACHE_COMPRESSION):
+    if name == "auto":
+        name = "lz4" if lz4 else "zlib"
+    for compressor in COMPRESSORS.values():
+        if compressor.name == name:
+            return compressor
+    logger.warning(f"Cache compression '{name}' is not available, falling back to zlib")
+    return COMPRESSORS[ZlibCompression.id]
+
+
+def compress_frame(frame: bytes, compressor, min_bytes: int = CACHE_COMPRESS_MIN_BYTES) -> bytes:
+    """Prefix the frame with the compressor id; frames below `min_bytes` are stored as-is."""
+    if len(frame) < min_bytes or compressor.id == NoCompression.id:
+        return NoCompression.id + frame
+    started = time.perf_counter()
+    compressed = compressor.compress(frame)
+    Metrics.incr("cache", "compress_seconds", time.perf_counter() - started)
+    if len(compressed) >= len(frame):
+        return NoCompression.id + frame
+    Metrics.incr("cache", "compressed_entries")
+    Metrics.incr("cache", "compress_bytes_in", len(frame))
+    Metrics.incr("cache", "compress_bytes_out", len(compressed))
+    return compressor.id + compressed
+
+
+def decompress_frame(data: bytes) -> bytes:
+    compressor = COMPRESSORS.get(data[:1])
+    if compressor is None:
+        raise ValueError(f"Unknown cache compression {data[:1]!r}")
+    if compressor.id == NoCompression.id:
+        return data[1:]
+    started = time.perf_counter()
+    frame = compressor.decompress(memoryview(data)[1:])
+    Metrics.incr("cache", "decompress_seconds", time.perf_counter() - started)
+    return frame
+
+
+def _compression_stats() -> Dict[str, Any]:
+    counters = Metrics._counters.get("cache", {})
+    bytes_out = counters.get("compress_bytes_out", 0)
+    return {"compression_ratio": round(counters.get("compress_bytes_in", 0) / bytes_out, 2) if bytes_out else None}
+
+
+Metrics.register("cache", _compression_stats)
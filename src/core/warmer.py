@@ -0,0 +1,98 @@
+# src/core/warmer.py
+import asyncio
+import logging
+from typing import Dict, Optional, Set
+import httpx
+from fastapi import FastAPI
+from src.core.metrics import Metrics
+from src.config.env import CACHE_WARM_PAGES, CACHE_WARM_DELAY
+
+logger = logging.getLogger(__name__)
+
+# Listings the homepage hits first, with the query parameter that pages them (None = single page)
+WARM_TARGETS: Dict[str, Optional[str]] = {
+    "/v1/blogs/": "page",
+    "/v1/events/": "page",
+    "/v1/categories/": None,
+    "/v1/faqs/": None,
+    "/v1/team/": "page",
+}
+WARM_CONCURRENCY = 4
+
+
+class CacheWarmer:
+    """
+    Refills the hottest cached listings so the first visitors after a deploy,
+    a Redis flush or a publish don't all miss at once.
+
+    Pages are requested in-process through the app itself, so they land under
+    exactly the keys (and with the same headers) the `cache` decorator uses.
+    """
+    _app: Optional[FastAPI] = None
+    _pending: Set[str] = set()
+    _tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def attach(cls, app: FastAPI):
+        cls._app = app
+
+    @classmethod
+    def detach(cls):
+        for task in cls._tasks:
+            task.cancel()
+        cls._pending.clear()
+        cls._app = None
+
+    @classmethod
+    def urls(cls, path: str, pages: int = CACHE_WARM_PAGES):
+        page_param = WARM_TARGETS.get(path)
+        yield path
+        if page_param:
+            for page in range(2, pages + 1):
+                yield f"{path}?{page_param}={page}"
+
+    @classmethod
+    async def warm(cls, *paths: str, pages: int = CACHE_WARM_PAGES) -> int:
+        """Request the first `pages` pages of each listing (all of them by default); returns how many were cached."""
+        if cls._app is None:
+            return 0
+        urls = [url for path in paths or WARM_TARGETS for url in cls.urls(path, pages)]
+        semaphore = asyncio.Semaphore(WARM_CONCURRENCY)
+        transport = httpx.ASGITransport(app=cls._app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://warmer") as client:
+            async def fetch(url: str) -> bool:
+                async with semaphore:
+                    try:
+                        response = await client.get(url)
+                    except Exception as e:
+                        logger.warning(f"Warming '{url}' failed: {e}")
+                        return False
+                    return response.status_code == 200
+
+            warmed = sum(await asyncio.gather(*(fetch(url) for url in urls)))
+
+        Metrics.incr("cache", "warmed", warmed)
+        return warmed
+
+    @classmethod
+    def schedule(cls, *paths: str):
+        """
+        Warm in the background. Called right after writes, so a burst of them
+        within `CACHE_WARM_DELAY` seconds is folded into one pass per listing.
+        """
+        if cls._app is None:
+            return
+        paths = [path for path in paths or WARM_TARGETS if path not in cls._pending]
+        if not paths:
+            return
+        cls._pending.update(paths)
+
+        async def run():
+            await asyncio.sleep(CACHE_WARM_DELAY)
+            cls._pending.difference_update(paths)
+            await cls.warm(*paths)
+
+        task = asyncio.create_task(run())
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
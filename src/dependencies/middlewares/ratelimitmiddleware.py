@@ -0,0 +1,30 @@
+import math
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from src.core.ratelimit import RateLimiter
+from src.utilities.meta import get_ipaddr
+
+
+class RateLimitMiddleware:
+    """Answers 429 with `Retry-After` once a client runs out of tokens for a rate-limited router."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        matched = RateLimiter.match(scope["path"], scope["method"])
+        if matched:
+            prefix, policy = matched
+            ip_address = get_ipaddr(Request(scope))
+            retry_after = await RateLimiter.hit(prefix, scope["method"], ip_address, policy)
+            if retry_after:
+                response = JSONResponse(
+                    {"detail": "Too many requests, slow down"},
+                    status_code=429,
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                )
+                return await response(scope, receive, send)
+        await self.app(scope, receive, send)
@@ -1,11 +1,21 @@
-from fastapi import Depends
+import itertools
+from fastapi import Depends, Request
 from src.apps.auth import User
+from src.apps.auth.user.schemas import Principal
+from src.core.cache import CachingService, vary_resolver
 from src.enums.base import Action, Resource
 from src.error.base import ErrorHandler
 from src.utilities.crypto import JWTService
 from src.apps.auth.permisssion import Permission
 
 
+# One bit per Action x Resource pair; a user's effective permissions fit in one int
+PERMISSION_BITS = {
+    (action, resource): 1 << bit
+    for bit, (resource, action) in enumerate(itertools.product(Resource, Action))
+}
+ALL_PERMISSIONS = sum(PERMISSION_BITS.values())
+PERMISSION_TTL = 3600
 
 
 class AuthPermissionService:
@@ -13,22 +23,58 @@ class AuthPermissionService:
     jwt = JWTService()
 
     @classmethod
-    async def has_permission(cls, user: User, action: Action, resource: Resource) -> bool:
+    async def has_permission(cls, user: Principal, action: Action, resource: Resource) -> bool:
         if user.is_superuser:
             return True
+        mask = await cls.permission_mask(str(user.id))
+        return bool(mask & PERMISSION_BITS[(Action(action), Resource(resource))])
 
-        groups = await user.permission_groups.all().prefetch_related("permissions")
-        for group in groups:
-            perms = await group.permissions.all()
-            for perm in perms:
-                if perm.action == action and perm.resource == resource:
-                    return True
-        return False
+    @classmethod
+    async def permission_mask(cls, user_id: str) -> int:
+        """
+        The user's effective permissions as a bitmask, compiled from their groups
+        once and cached. Writes to groups, permissions or the user clear it
+        through the `permissions:{user_id}` / `permissions:*` tags.
+        """
+        async def compile_mask() -> int:
+            user = await User.get_or_none(id=user_id)
+            if not user:
+                return 0
+            if user.is_superuser:
+                return ALL_PERMISSIONS
+            grants = await user.permission_groups.filter(is_deleted=False).values_list(
+                "permissions__action", "permissions__resource", "permissions__is_deleted"
+            )
+            return sum({
+                PERMISSION_BITS[(Action(action), Resource(resource))]
+                for action, resource, deleted in grants if action and not deleted
+            })
+
+        return await CachingService.cache_or_fetch(
+            f"permissions:{user_id}", compile_mask, PERMISSION_TTL,
+            tags=[f"permissions:{user_id}", "permissions:*"],
+        )
 
     @classmethod
     def permission_required(cls, action: Action, resource: Resource):
-        async def dependency(user: User = Depends(cls.jwt.get_current_user)):
+        async def dependency(user: Principal = Depends(cls.jwt.get_current_user)):
             if not await AuthPermissionService.has_permission(user, action, resource):
                 raise cls.error.get(403)
             return user
-        return dependency
\ No newline at end of file
+        return dependency
+
+    @classmethod
+    async def permission_fingerprint(cls, user_id: str) -> str:
+        """Stable id of everything the user is allowed to do; changes whenever their grants do."""
+        return f"{await cls.permission_mask(user_id):x}"
+
+
+@vary_resolver("user")
+async def vary_on_user(request: Request) -> str:
+    return JWTService.get_request_subject(request) or "anonymous"
+
+
+@vary_resolver("permissions")
+async def vary_on_permissions(request: Request) -> str:
+    user_id = JWTService.get_request_subject(request)
+    return await AuthPermissionService.permission_fingerprint(user_id) if user_id else "anonymous"
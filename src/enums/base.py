@@ -77,6 +77,13 @@ class EmailCategory(str, Enum):
     NEWSLETTER = "newsletter"
 
 
+class TotalMode(str, Enum):
+    EXACT = "exact"          # count(*) alongside the page query, concurrently
+    WINDOW = "window"        # count(*) OVER() in the page query itself
+    ESTIMATE = "estimate"    # planner row estimate
+    CACHED = "cached"        # count cached until the resource's next write
+
+
 class ContentStatus(str, Enum):
     PUBLISH = "published"
     DRAFT = "draft"
\ No newline at end of file
@@ -0,0 +1,394 @@
+import argparse
+import asyncio
+import datetime
+import itertools
+import json
+import multiprocessing
+import random
+import time
+import uuid
+import httpx
+from fastapi import FastAPI, Query, Request
+from src.core.cache import CachingService, cache
+from src.utilities.hash import set_password, verify_password, verify_password_async
+from src.core.serializers import (
+    CODECS,
+    COMPRESSORS,
+    CacheEntry,
+    CachedResponse,
+    compress_frame,
+    decompress_frame,
+    dumps_entry,
+    dumps_json,
+    loads_entry,
+)
+
+
+DB_LATENCY = 0.05
+
+
+async def naive_cache_or_fetch(key, fetch_func, ttl):
+    """What `CachingService.cache_or_fetch` did before single-flight: every miss fetches."""
+    cached = await CachingService.get(key)
+    if cached is not None:
+        return cached
+    data = await fetch_func()
+    await CachingService.set(key, data, ttl)
+    return data
+
+
+async def _expiry_burst_worker(mode: str, host: str, port: int, concurrency: int, start_at: float) -> int:
+    await CachingService.open_conn(host=host, port=port)
+    queries = 0
+
+    async def fetch():
+        nonlocal queries
+        queries += 1
+        await asyncio.sleep(DB_LATENCY)
+        return {"page": 1, "results": list(range(10))}
+
+    lookup = naive_cache_or_fetch if mode == "before" else CachingService.cache_or_fetch
+    await asyncio.sleep(max(0.0, start_at - time.time()))
+    await asyncio.gather(*(lookup("bench:expiry-burst", fetch, 60) for _ in range(concurrency)))
+    await CachingService.close_conn()
+    return queries
+
+
+def _run_worker(args) -> int:
+    return asyncio.run(_expiry_burst_worker(*args))
+
+
+def expiry_burst(args: argparse.Namespace):
+    """Count database fetches when `workers` processes each fire `concurrency` requests at an expired key."""
+    host, port, workers, concurrency = args.host, args.port, args.workers, args.concurrency
+    for mode in ("before", "after"):
+        async def reset():
+            await CachingService.open_conn(host=host, port=port)
+            await CachingService._conn.delete("bench:expiry-burst", "lock:bench:expiry-burst")
+            await CachingService.close_conn()
+
+        asyncio.run(reset())
+        start_at = time.time() + 1
+        with multiprocessing.Pool(workers) as pool:
+            counts = pool.map(_run_worker, [(mode, host, port, concurrency, start_at)] * workers)
+        print(f"{mode:>6}: {sum(counts):4d} DB queries for {workers * concurrency} concurrent misses")
+
+
+def blog_list_payload(posts: int = 10, content_size: int = 20_000) -> dict:
+    """Same shape as `BlogService.all`, with realistic article bodies."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return {
+        "page": 1,
+        "page_size": posts,
+        "total": 250,
+        "data": [
+            {
+                "id": str(uuid.uuid4()),
+                "title": f"Mortgage update {i}",
+                "slug": f"mortgage-update-{i}",
+                "content": "<p>" + "Lorem ipsum dolor sit amet. " * (content_size // 28) + "</p>",
+                "status": "published",
+                "category": "News",
+                "author": "Default Admin",
+                "images": [f"https://res.cloudinary.com/demo/image/upload/{uuid.uuid4()}.jpg"],
+                "tags": ["housing", "finance"],
+                "views_count": i * 17,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(posts)
+        ],
+    }
+
+
+def _throughput(func, seconds: float = 1.0) -> float:
+    calls, start = 0, time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        func()
+        calls += 1
+    return calls / elapsed
+
+
+def codecs(args: argparse.Namespace):
+    """Encode/decode throughput of the blog list payload for each cache codec."""
+    payload = blog_list_payload()
+    legacy = json.dumps(payload, default=str)
+    print(f"payload: {len(legacy) / 1024:.0f} KiB as JSON")
+    print(f"{'codec':<10}{'encode/s':>12}{'decode/s':>12}{'size KiB':>10}")
+    print(f"{'json':<10}{_throughput(lambda: json.dumps(payload, default=str)):>12.0f}"
+          f"{_throughput(lambda: json.loads(legacy)):>12.0f}{len(legacy) / 1024:>10.0f}")
+    for codec in CODECS.values():
+        frame = dumps_entry(CacheEntry(payload), codec)
+        print(f"{codec.name:<10}{_throughput(lambda: dumps_entry(CacheEntry(payload), codec)):>12.0f}"
+              f"{_throughput(lambda: loads_entry(frame)):>12.0f}{len(frame) / 1024:>10.0f}")
+    response = dumps_entry(CacheEntry(CachedResponse(dumps_json(payload))), None)
+    print(f"{'response':<10}{_throughput(lambda: dumps_entry(CacheEntry(CachedResponse(dumps_json(payload))), None)):>12.0f}"
+          f"{_throughput(lambda: loads_entry(response)):>12.0f}{len(response) / 1024:>10.0f}")
+
+
+def compression(args: argparse.Namespace):
+    """Size and CPU cost of each compressor on the cached blog list response."""
+    frame = dumps_entry(CacheEntry(CachedResponse(dumps_json(blog_list_payload()))), None)
+    print(f"frame: {len(frame) / 1024:.0f} KiB")
+    print(f"{'method':<10}{'compress/s':>12}{'decompress/s':>14}{'size KiB':>10}{'ratio':>8}")
+    for compressor in COMPRESSORS.values():
+        stored = compress_frame(frame, compressor, min_bytes=0)
+        print(f"{compressor.name:<10}{_throughput(lambda: compress_frame(frame, compressor, min_bytes=0)):>12.0f}"
+              f"{_throughput(lambda: decompress_frame(stored)):>14.0f}{len(stored) / 1024:>10.0f}"
+              f"{len(frame) / len(stored):>8.1f}")
+
+
+def _listing_queries(requests: int, seed: int = 7) -> list:
+    """Query strings the way the frontend, crawlers and shared links actually send them."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(requests):
+        page = rng.choice([1, 1, 1, 1, 2, 2, 3])
+        params = []
+        if page != 1 or rng.random() < 0.5:
+            params.append(("page", page))
+        if rng.random() < 0.6:
+            params.append(("count", 10))
+        if rng.random() < 0.1:
+            params.append(("category", rng.choice(["News", "news"])))
+        if rng.random() < 0.2:
+            params.append(("_", rng.randrange(10**6)))  # cache buster
+        rng.shuffle(params)
+        queries.append("&".join(f"{name}={value}" for name, value in params))
+    return queries
+
+
+async def _key_replay(host: str, port: int, requests: int):
+    await CachingService.open_conn(host=host, port=port)
+    await CachingService.invalidate("bench:*")
+    fetches = itertools.count()
+    app = FastAPI()
+
+    @app.get("/v1/blogs/")
+    @cache(ttl=60, tags=["bench:*"])
+    async def list_blogs(
+        request: Request,
+        author: str = Query(None),
+        category: str = Query(None),
+        page: int = Query(1, ge=1),
+        count: int = Query(10, ge=1, le=100),
+    ):
+        next(fetches)
+        return {"page": page, "count": count}
+
+    queries = _listing_queries(requests)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for query in queries:
+            await client.get(f"/v1/blogs/?{query}")
+    await CachingService.invalidate("bench:*")
+    await CachingService.close_conn()
+    raw_keys = len(set(queries))
+    return raw_keys, next(fetches)
+
+
+def key_replay(args: argparse.Namespace):
+    """Hit ratio of raw-URL keys versus canonical keys over a replay of listing query permutations."""
+    requests = args.concurrency * 50
+    raw_keys, canonical_misses = asyncio.run(_key_replay(args.host, args.port, requests))
+    print(f"{requests} listing requests")
+    print(f" raw URL keys: {raw_keys:5d} misses, hit ratio {1 - raw_keys / requests:.1%}")
+    print(f"canonical keys: {canonical_misses:5d} misses, hit ratio {1 - canonical_misses / requests:.1%}")
+
+
+async def _loop_lag(samples: list, interval: float = 0.005):
+    """Record how late the event loop wakes up from short sleeps."""
+    while True:
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - expected)
+
+
+async def _password_lag(mode: str, logins: int, seconds: float) -> tuple:
+    await CachingService.open_conn(backend="memory")
+    app = FastAPI()
+
+    @app.get("/v1/blogs/")
+    @cache(ttl=60)
+    async def list_blogs(request: Request):
+        return blog_list_payload(posts=2, content_size=500)
+
+    hashed = set_password("correct horse battery staple")
+    deadline = time.perf_counter() + seconds
+    served, lag = 0, []
+
+    async def login():
+        while time.perf_counter() < deadline:
+            if mode == "sync":
+                verify_password(hashed, "correct horse battery staple")
+            else:
+                await verify_password_async(hashed, "correct horse battery staple")
+            await asyncio.sleep(0)
+
+    async def browse(client):
+        nonlocal served
+        while time.perf_counter() < deadline:
+            await client.get("/v1/blogs/")
+            served += 1
+            await asyncio.sleep(0)  # in-process transport never yields on its own
+
+    monitor = asyncio.create_task(_loop_lag(lag))
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        await asyncio.gather(*(login() for _ in range(logins if mode != "idle" else 0)), *(browse(client) for _ in range(4)))
+    monitor.cancel()
+    await CachingService.close_conn()
+    lag.sort()
+    return served / seconds, lag[int(len(lag) * 0.99)] * 1000, lag[-1] * 1000
+
+
+def password_lag(args: argparse.Namespace):
+    """Event-loop lag and public GET throughput while logins verify passwords inline vs on the hash pool."""
+    logins = max(1, args.concurrency // 10)
+    print(f"{logins} concurrent logins, 4 clients browsing a cached listing")
+    print(f"{'mode':<8}{'GET/s':>10}{'p99 lag ms':>12}{'max lag ms':>12}")
+    for mode in ("idle", "sync", "pool"):
+        throughput, p99, worst = asyncio.run(_password_lag(mode, logins, seconds=3))
+        print(f"{mode:<8}{throughput:>10.0f}{p99:>12.1f}{worst:>12.1f}")
+
+
+async def _naive_bulk(model, ids: list, op: str):
+    """What `BaseObjectService` bulk methods did before: load every row, then one statement each."""
+    if op == "delete":
+        for obj in await model.filter(id__in=ids).all():
+            await obj.delete()
+        return
+    for obj in await model.filter(id__in=ids, is_deleted=op == "recover").all():
+        obj.is_deleted = op == "trash"
+        await obj.save()
+
+
+async def _bulk_ops(rows: int) -> list:
+    from tortoise import Tortoise
+    from src.apps.public.subscribers.models import Subscriber
+    from src.utilities.base_service import BaseObjectService
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.core.models"]})
+    await Tortoise.generate_schemas()
+    service = BaseObjectService(Subscriber)
+    timings = []
+    try:
+        for mode in ("naive", "set-based"):
+            await Subscriber.bulk_create([Subscriber(email=f"{mode}{i}@example.com") for i in range(rows)], batch_size=1000)
+            ids = [str(pk) for pk in await Subscriber.all().values_list("id", flat=True)]
+            for op, method in (("trash", service.bulk_trash), ("recover", service.recover), ("delete", service.bulk_delete)):
+                started = time.perf_counter()
+                if mode == "naive":
+                    await _naive_bulk(Subscriber, ids, op)
+                else:
+                    await method(ids)
+                timings.append((mode, op, time.perf_counter() - started))
+    finally:
+        await Tortoise.close_connections()
+    return timings
+
+
+def bulk_ops(args: argparse.Namespace):
+    """Bulk trash / recover / delete of `--rows` ids: per-object saves versus chunked set-based statements."""
+    print(f"{args.rows} rows (sqlite in memory; network round trips to Postgres widen the gap)")
+    print(f"{'mode':<12}{'operation':<10}{'seconds':>10}")
+    for mode, op, seconds in asyncio.run(_bulk_ops(args.rows)):
+        print(f"{mode:<12}{op:<10}{seconds:>10.3f}")
+
+
+async def _deep_pages(rows: int, count: int = 20) -> list:
+    from tortoise import Tortoise
+    from src.apps.public.contact.models import Team
+    from src.utilities.pagination import encode_cursor, paginate
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.core.models"]})
+    await Tortoise.generate_schemas()
+    timings = []
+    try:
+        start = datetime.datetime(2025, 1, 1)
+        await Team.bulk_create(
+            [Team(name=f"member {i}", position="staff", created_at=start + datetime.timedelta(seconds=i)) for i in range(rows)],
+            batch_size=1000,
+        )
+        query = Team.filter(is_deleted=False)
+        for page in (1, rows // count // 10, rows // count // 2, rows // count):
+            started = time.perf_counter()
+            await paginate(query, page, count)
+            by_offset = time.perf_counter() - started
+            # The cursor the client would hold after reading the previous page
+            previous = await query.order_by("-created_at", "-id").offset((page - 1) * count - 1).first() if page > 1 else None
+            started = time.perf_counter()
+            await paginate(query, page, count, encode_cursor(previous) if previous else None)
+            timings.append((page, by_offset, time.perf_counter() - started))
+    finally:
+        await Tortoise.close_connections()
+    return timings
+
+
+def deep_pages(args: argparse.Namespace):
+    """Latency of page N by OFFSET (plus its count) versus by keyset cursor, over `--rows` team rows."""
+    print(f"{args.rows} rows, 20 per page (sqlite in memory)")
+    print(f"{'page':>6}{'offset ms':>12}{'cursor ms':>12}")
+    for page, by_offset, by_cursor in asyncio.run(_deep_pages(args.rows)):
+        print(f"{page:>6}{by_offset * 1000:>12.2f}{by_cursor * 1000:>12.2f}")
+
+
+async def _list_totals(rows: int, repeats: int = 20) -> list:
+    from tortoise import Tortoise
+    from src.apps.public.subscribers import Subscriber
+    from src.enums.base import TotalMode
+    from src.utilities.pagination import paginate
+
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.core.models"]})
+    await Tortoise.generate_schemas()
+    timings = []
+    try:
+        await Subscriber.bulk_create([Subscriber(email=f"reader{i}@example.com") for i in range(rows)], batch_size=1000)
+        query = Subscriber.filter(is_deleted=False)
+        started = time.perf_counter()
+        for _ in range(repeats):
+            await query.count()
+            await query.order_by("-created_at", "-id").limit(20)
+        timings.append(("separate", (time.perf_counter() - started) / repeats))
+        for mode in TotalMode:
+            started = time.perf_counter()
+            for _ in range(repeats):
+                await paginate(query, 1, 20, total=mode, count_tags=["subscriber:*"])
+            timings.append((mode.value, (time.perf_counter() - started) / repeats))
+    finally:
+        await Tortoise.close_connections()
+    return timings
+
+
+def list_totals(args: argparse.Namespace):
+    """First-page latency over `--rows` subscribers: count then page, versus each `TotalMode`."""
+    print(f"{args.rows} rows, 20 per page (sqlite in memory: estimates fall back to an exact count)")
+    print(f"{'total':<10}{'ms':>10}")
+    for mode, seconds in asyncio.run(_list_totals(args.rows)):
+        print(f"{mode:<10}{seconds * 1000:>10.2f}")
+
+
+SCENARIOS = {
+    "expiry-burst": expiry_burst,
+    "codecs": codecs,
+    "compression": compression,
+    "key-replay": key_replay,
+    "password-lag": password_lag,
+    "bulk-ops": bulk_ops,
+    "deep-pages": deep_pages,
+    "list-totals": list_totals,
+}
+
+
+def run():
+    parser = argparse.ArgumentParser(description="Cache and hashing benchmarks")
+    parser.add_argument("scenario", choices=SCENARIOS)
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=6379)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=40)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    SCENARIOS[args.scenario](args)
+
+
+if __name__ == "__main__":
+    run()
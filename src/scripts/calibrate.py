@@ -0,0 +1,81 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import time
+from argon2 import PasswordHasher
+from src.config.env import ARGON2_PROFILE, PASSWORD_HASH_CONCURRENCY
+
+# Candidate memory costs in KiB, largest first: RFC 9106 prefers spending the budget on memory
+MEMORY_CANDIDATES = (262144, 131072, 65536, 47104, 19456)
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """Median milliseconds for one hash with these parameters."""
+    hasher = PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(target_ms: float, max_memory: int, parallelism: int, max_time_cost: int, samples: int) -> dict:
+    """
+    Pick the largest memory cost that hashes within `target_ms`, then the largest
+    time cost that still fits. Falls back to the cheapest candidate if none does.
+    """
+    print(f"{'memory KiB':>12}{'time':>6}{'ms':>10}")
+    best = None
+    for memory_cost in (m for m in MEMORY_CANDIDATES if m <= max_memory):
+        for time_cost in range(1, max_time_cost + 1):
+            elapsed = measure(time_cost, memory_cost, parallelism, samples)
+            print(f"{memory_cost:>12}{time_cost:>6}{elapsed:>10.1f}")
+            if elapsed > target_ms:
+                break
+            best = {"time_cost": time_cost, "memory_cost": memory_cost, "measured_ms": round(elapsed, 1)}
+        if best:
+            break
+    if best is None:
+        memory_cost = min(MEMORY_CANDIDATES)
+        best = {"time_cost": 1, "memory_cost": memory_cost, "measured_ms": round(measure(1, memory_cost, parallelism, samples), 1)}
+        print(f"Nothing fits in {target_ms}ms; using the cheapest parameters")
+    return {**best, "parallelism": parallelism}
+
+
+def run():
+    defaults = PasswordHasher()
+    parser = argparse.ArgumentParser(description="Measure Argon2 cost on this machine and write a hashing profile")
+    parser.add_argument("--target-ms", type=float, default=250, help="hash latency to aim for")
+    parser.add_argument("--max-memory-mib", type=int, default=128, help="memory per hash; peak is this times PASSWORD_HASH_CONCURRENCY")
+    parser.add_argument("--parallelism", type=int, default=defaults.parallelism)
+    parser.add_argument("--max-time-cost", type=int, default=10)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--output", default=ARGON2_PROFILE)
+    parser.add_argument("--dry-run", action="store_true", help="print the profile without writing it")
+    args = parser.parse_args()
+
+    params = calibrate(args.target_ms, args.max_memory_mib * 1024, args.parallelism, args.max_time_cost, args.samples)
+    profile = {
+        **params,
+        "hash_len": defaults.hash_len,
+        "salt_len": defaults.salt_len,
+        "target_ms": args.target_ms,
+        # A full pool of concurrent hashes, to judge the login throughput this buys
+        "logins_per_second": round(PASSWORD_HASH_CONCURRENCY * 1000 / params["measured_ms"], 1),
+        "host": platform.node(),
+        "cpu_count": os.cpu_count(),
+        "calibrated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+    print(json.dumps(profile, indent=2))
+    if not args.dry_run:
+        with open(args.output, "w") as f:
+            json.dump(profile, f, indent=2)
+        print(f"Wrote {args.output}; restart the app to use it. Existing hashes are upgraded as users log in.")
+
+
+if __name__ == "__main__":
+    run()
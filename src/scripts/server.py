@@ -9,9 +9,11 @@ from src.core.routes import routes
 from contextlib import asynccontextmanager
 from src.logs.logger import JSONFormatter
 from src.dependencies.middlewares.logmiddleware import LoggingMiddleware
+from src.dependencies.middlewares.ratelimitmiddleware import RateLimitMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 import logging
 from src.core.cache import CachingService
+from src.core.warmer import CacheWarmer
 
 logging.getLogger("tortoise").setLevel(logging.CRITICAL)
 
@@ -28,7 +30,10 @@ root_logger.setLevel(logging.INFO)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await CachingService.open_conn()
+    CacheWarmer.attach(app)
+    CacheWarmer.schedule()
     yield
+    CacheWarmer.detach()
     await CachingService.close_conn()
 
 
@@ -62,6 +67,7 @@ register_tortoise(
 )
 
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(RateLimitMiddleware)  # inside CORS so 429s still carry CORS headers
 allowed_origins = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
@@ -3,7 +3,7 @@ import uuid
 
 class BaseModel(Model):
     id = fields.UUIDField(pk=True, default=uuid.uuid4, editable=False)
-    created_at = fields.DatetimeField(null=True, auto_now_add=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(null=True)
     is_deleted = fields.BooleanField(default=False)
 
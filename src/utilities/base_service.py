@@ -1,6 +1,10 @@
-from tortoise import Model
-from typing import Type, List, Optional
+from tortoise import Model, timezone
+from tortoise.transactions import in_transaction
+from typing import Type, List, Optional, Sequence
 from src.error.base import ErrorHandler
+from src.config.env import DB_BULK_CHUNK_SIZE
+from src.enums.base import TotalMode
+from src.utilities.pagination import paginate
 
 
 class BaseObjectService:
@@ -14,29 +18,34 @@ class BaseObjectService:
     async def filter_object(self, **kwargs):
         return await self.model.filter(is_deleted=False, **kwargs).all()
 
+    async def get_many(self, ids: List[str]):
+        """Objects for the given ids in a single `id__in` query, keyed by id; unknown ids are skipped."""
+        objs = await self.model.filter(id__in=ids, is_deleted=False).all()
+        return {str(obj.id): obj for obj in objs}
+
     async def all(
         self,
         prefetch_related: Optional[List[str]] = None,
         select_related: Optional[List[str]] = None,
         page: int = 1,
-        count: int = 10
+        count: int = 10,
+        cursor: Optional[str] = None,
+        total: TotalMode = TotalMode.EXACT,
+        count_tags: Sequence[str] = (),
     ):
-        offset = (page - 1) * count
+        """
+        Page by number in the model's own ordering, or, for models that `supports_keyset`,
+        with `cursor` (the previous page's `next_cursor`) for constant-cost deep pages.
+        `total` picks how the page-number total is counted; `count_tags` invalidate a cached one.
+        """
         query = self.model.filter(is_deleted=False)
 
         if select_related:
             query = query.select_related(*select_related)
         if prefetch_related:
             query = query.prefetch_related(*prefetch_related)
-        total = await query.count()
-        query = query.offset(offset).limit(count)
-        results = await query.all()
-        return {
-            "page": page,
-            "page_size": count,
-            "total": total,
-            "results": results,
-        }
+        results, page_info = await paginate(query, page, count, cursor, total, count_tags)
+        return {**page_info, "results": results}
 
 
     async def trash(self, id: str):
@@ -54,22 +63,28 @@ class BaseObjectService:
         await obj.delete()
         return True
 
-    async def recover(self, ids: List[str]):
-        objs = await self.model.filter(id__in=ids, is_deleted=True).all()
-        for obj in objs:
-            obj.is_deleted = False
-            await obj.save()
-        return objs
+    async def _bulk(self, ids: List[str], apply) -> int:
+        """
+        Run `apply(queryset)` over `ids` in chunks of `DB_BULK_CHUNK_SIZE`, one statement
+        per chunk and all in one transaction. Returns the number of rows affected.
+        """
+        ids = list(dict.fromkeys(ids))
+        affected = 0
+        async with in_transaction() as conn:
+            for start in range(0, len(ids), DB_BULK_CHUNK_SIZE):
+                chunk = ids[start:start + DB_BULK_CHUNK_SIZE]
+                affected += await apply(self.model.filter(id__in=chunk).using_db(conn))
+        return affected
 
-    async def bulk_trash(self, ids: List[str]):
-        objs = await self.model.filter(id__in=ids, is_deleted=False).all()
-        for obj in objs:
-            obj.is_deleted = True
-            await obj.save()
-        return objs
+    async def recover(self, ids: List[str]) -> int:
+        return await self._bulk(
+            ids, lambda query: query.filter(is_deleted=True).update(is_deleted=False, updated_at=timezone.now())
+        )
 
-    async def bulk_delete(self, ids: List[str]):
-        objs = await self.model.filter(id__in=ids).all()
-        for obj in objs:
-            await obj.delete()
-        return True
+    async def bulk_trash(self, ids: List[str]) -> int:
+        return await self._bulk(
+            ids, lambda query: query.filter(is_deleted=False).update(is_deleted=True, updated_at=timezone.now())
+        )
+
+    async def bulk_delete(self, ids: List[str]) -> int:
+        return await self._bulk(ids, lambda query: query.delete())
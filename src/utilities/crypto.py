@@ -1,13 +1,18 @@
 import jwt
+import uuid
 from argon2 import PasswordHasher
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from datetime import datetime, timedelta, timezone
 from fastapi import Depends, status, Request, HTTPException
 from jwt import ExpiredSignatureError, InvalidTokenError, decode
 from src.apps.auth.user.models import User
+from src.apps.auth.user.schemas import Principal
 from typing import Dict
 from src.error.base import ErrorHandler
+from src.core.cache import CachingService
+from src.core.revocation import TokenDenylist
 from src.config.env import (
+    AUTH_PRINCIPAL_TTL,
     JWT_ACCESS_EXPIRY,
     JWT_REFRESH_EXPIRY,
     JWT_ACCESS_SECRET,
@@ -28,13 +33,15 @@ class JWTService:
         access_payload = {
             "sub": str(user_id),
             "exp": access_exp,
-            "type": "access"
+            "type": "access",
+            "jti": uuid.uuid4().hex
         }
 
         refresh_payload = {
             "sub": str(user_id),
             "exp": refresh_exp,
-            "type": "refresh"
+            "type": "refresh",
+            "jti": uuid.uuid4().hex
         }
 
         access_token = jwt.encode(access_payload, JWT_ACCESS_SECRET, algorithm=JWT_ALGORITHM)
@@ -66,6 +73,17 @@ class JWTService:
         user_id = payload.get("sub") 
         return JWTService.generate_token(user_id)
 
+    @staticmethod
+    async def revoke_tokens(*tokens: str):
+        """Deny the given tokens until they expire. Tokens that are already invalid are skipped."""
+        for token in tokens:
+            try:
+                payload = JWTService.decode_token(token)
+            except HTTPException:
+                continue
+            if payload.get("jti"):
+                await TokenDenylist.revoke(payload["jti"], payload["exp"])
+
     @staticmethod
     def get_subject(token: str) -> str:
         payload = JWTService.decode_token(token)
@@ -75,6 +93,21 @@ class JWTService:
     
         
 
+    @staticmethod
+    def get_request_subject(request: Request) -> str | None:
+        """User id from the access token cookie or bearer header, without touching the database."""
+        access_token = request.cookies.get("access_token")
+        scheme, _, credentials = request.headers.get("authorization", "").partition(" ")
+        if not access_token and scheme.lower() == "bearer":
+            access_token = credentials
+        if not access_token:
+            return None
+        try:
+            sub = JWTService.decode_token(access_token).get("sub")
+        except HTTPException:
+            return None
+        return str(sub.get("id") if isinstance(sub, dict) else sub) if sub else None
+
     @staticmethod
     async def get_current_user(
         request: Request,
@@ -101,15 +134,33 @@ class JWTService:
         except InvalidTokenError:
             raise HTTPException(status_code=401, detail="Invalid access token")
 
+        if await TokenDenylist.is_revoked(payload.get("jti")):
+            raise HTTPException(status_code=401, detail="Token revoked")
+
         sub = payload.get("sub")
         if not sub:
             raise credentials_exception
 
         user_id = sub.get("id") if isinstance(sub, dict) else sub
 
-        user = await User.get_or_none(id=user_id)
-        if not user:
+        principal = await JWTService.get_principal(str(user_id))
+        if not principal:
             raise credentials_exception
 
-        return user
+        return principal
+
+    @staticmethod
+    async def get_principal(user_id: str) -> Principal | None:
+        """
+        The user behind a token, cached for `AUTH_PRINCIPAL_TTL` seconds so a page's
+        worth of admin calls share one lookup. Cleared through the `principal:{id}` tag.
+        """
+        async def fetch():
+            user = await User.get_or_none(id=user_id)
+            return Principal.model_validate(user).model_dump(mode="json") if user else None
+
+        data = await CachingService.cache_or_fetch(
+            f"principal:{user_id}", fetch, AUTH_PRINCIPAL_TTL, tags=[f"principal:{user_id}"]
+        )
+        return Principal(**data) if data else None
 
@@ -1,6 +1,30 @@
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from argon2 import PasswordHasher
+from src.core.metrics import Metrics
+from src.config.env import ARGON2_PROFILE, PASSWORD_HASH_CONCURRENCY
 
-ph = PasswordHasher()
+logger = logging.getLogger(__name__)
+
+HASH_PARAMETERS = ("time_cost", "memory_cost", "parallelism", "hash_len", "salt_len")
+
+
+def load_profile(path: str = ARGON2_PROFILE) -> dict:
+    """Argon2 parameters from a calibration profile; empty (library defaults) if there is none."""
+    try:
+        with open(path) as f:
+            profile = json.load(f)
+    except FileNotFoundError:
+        return {}
+    params = {name: int(profile[name]) for name in HASH_PARAMETERS if name in profile}
+    logger.info(f"Argon2 parameters from {path}: {params}")
+    return params
+
+
+ph = PasswordHasher(**load_profile())
 
 def set_password(password: str) -> str:
     return ph.hash(password)
@@ -11,3 +35,57 @@ def verify_password(hashed_password: str, plain_password: str) -> bool:
         return True
     except Exception:
         return False
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True if the hash was made with other parameters than the current profile (cheap: parses only)."""
+    outdated = ph.check_needs_rehash(hashed_password)
+    if outdated:
+        Metrics.incr("password", "outdated")
+    return outdated
+
+
+class PasswordHashPool:
+    """
+    Argon2 is deliberately slow and CPU-bound, so it runs on a small dedicated
+    thread pool (argon2-cffi releases the GIL) instead of blocking the event loop.
+    At most `PASSWORD_HASH_CONCURRENCY` hashes run at once; the rest wait in line.
+    """
+    _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_CONCURRENCY, thread_name_prefix="argon2")
+    _pending = 0
+
+    @classmethod
+    async def run(cls, func, *args):
+        submitted = time.perf_counter()
+        started = None
+
+        def timed():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args)
+
+        cls._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(cls._executor, timed)
+        finally:
+            cls._pending -= 1
+            Metrics.incr("password", "calls")
+            if started is not None:
+                Metrics.incr("password", "wait_seconds", started - submitted)
+                Metrics.incr("password", "hash_seconds", time.perf_counter() - started)
+
+    @classmethod
+    def stats(cls) -> dict:
+        running = min(cls._pending, PASSWORD_HASH_CONCURRENCY)
+        return {"queued": cls._pending - running, "running": running, "concurrency": PASSWORD_HASH_CONCURRENCY}
+
+
+Metrics.register("password", PasswordHashPool.stats)
+
+
+async def set_password_async(password: str) -> str:
+    Metrics.incr("password", "hashes")
+    return await PasswordHashPool.run(set_password, password)
+
+async def verify_password_async(hashed_password: str, plain_password: str) -> bool:
+    Metrics.incr("password", "verifies")
+    return await PasswordHashPool.run(verify_password, hashed_password, plain_password)
@@ -1,6 +1,15 @@
-
 from fastapi import Request
+from src.config.env import TRUSTED_PROXY_HOPS
 
 def get_ipaddr(request: Request):
-    x_forwarded_for = request.headers.get("x-forwarded-for")
-    return x_forwarded_for.split(",")[0].strip() if x_forwarded_for else request.client.host
+    """
+    The client's address as seen by the outermost trusted proxy. Each of the
+    `TRUSTED_PROXY_HOPS` proxies appends the address it received from, so only the
+    right-most entries of X-Forwarded-For can be trusted; anything left of them is
+    whatever the client sent.
+    """
+    if TRUSTED_PROXY_HOPS:
+        forwarded = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if len(forwarded) >= TRUSTED_PROXY_HOPS:
+            return forwarded[-TRUSTED_PROXY_HOPS]
+    return request.client.host if request.client else None
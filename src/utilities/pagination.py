@@ -0,0 +1,156 @@
+import asyncio
+import base64
+import datetime
+import hashlib
+import uuid
+from typing import Any, List, Optional, Sequence, Tuple, Type
+import orjson
+from fastapi import HTTPException
+from tortoise.expressions import Q, RawSQL
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+from src.core.cache import CachingService
+from src.config.env import LIST_COUNT_CACHE_TTL
+from src.enums.base import TotalMode
+
+# Newest first, with the id breaking ties between rows created in the same instant.
+# Matches the composite (created_at, id) indexes, so a page is one index range scan.
+KEYSET_ORDERING = ("-created_at", "-id")
+KEYSET_INDEX = ("created_at", "id")
+
+
+def supports_keyset(model: Type[Model]) -> bool:
+    """
+    Models opt in to cursors by declaring the `KEYSET_INDEX`; their pages follow
+    `KEYSET_ORDERING`. Any other model keeps its own `Meta.ordering` and only pages by number.
+    """
+    return any(tuple(index) == KEYSET_INDEX for index in model._meta.indexes if isinstance(index, (tuple, list)))
+
+
+def encode_cursor(obj: Any) -> str:
+    """Opaque token pointing just past `obj` in `KEYSET_ORDERING`."""
+    raw = orjson.dumps([obj.created_at.isoformat(), str(obj.id)])
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = orjson.loads(raw)
+        return datetime.datetime.fromisoformat(created_at), str(uuid.UUID(id))
+    except (ValueError, TypeError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def ordered(query: QuerySet) -> QuerySet:
+    return query.order_by(*KEYSET_ORDERING)
+
+
+async def keyset_page(query: QuerySet, cursor: Optional[str], count: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    The `count` rows after `cursor` (from the start if None) and the cursor for the
+    next page, or None on the last one. Cost is the same at any depth, unlike OFFSET.
+    """
+    query = ordered(query)
+    if cursor:
+        created_at, id = decode_cursor(cursor)
+        # The plain bound lets the planner start an index range scan at the cursor;
+        # the OR only settles ties on created_at
+        query = query.filter(created_at__lte=created_at).filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=id)
+        )
+    rows = await query.limit(count + 1)
+    if len(rows) <= count:
+        return list(rows), None
+    rows = rows[:count]
+    return rows, encode_cursor(rows[-1])
+
+
+async def estimated_count(query: QuerySet) -> int:
+    """
+    The planner's row estimate for `query`: no rows are read, but it is only as fresh
+    as the last ANALYZE. Exact count on databases without a usable planner estimate.
+    """
+    db = query.model._meta.db
+    if db.capabilities.dialect != "postgres":
+        return await query.count()
+    _, rows = await db.execute_query(f"EXPLAIN (FORMAT JSON) {query.sql(params_inline=True)}")
+    plan = rows[0][0]
+    if isinstance(plan, str):
+        plan = orjson.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def cached_count(query: QuerySet, tags: Sequence[str]) -> int:
+    """
+    Exact count of `query`, cached under `tags` so the resource's own invalidation on
+    write drops it; `LIST_COUNT_CACHE_TTL` bounds staleness from untagged writes.
+    """
+    sql = query.sql(params_inline=True)
+    key = f"count:{query.model._meta.db_table}:{hashlib.blake2b(sql.encode(), digest_size=12).hexdigest()}"
+    return await CachingService.cache_or_fetch(key, query.count, LIST_COUNT_CACHE_TTL, tags=list(tags))
+
+
+async def fetch_page(
+    query: QuerySet,
+    offset: int,
+    limit: int,
+    total: TotalMode = TotalMode.EXACT,
+    count_tags: Sequence[str] = (),
+) -> Tuple[List[Any], int]:
+    """
+    Rows `offset`..`offset + limit` of `query` and its total, counted per `total`.
+
+    WINDOW counts in the page query itself, saving a round trip but visiting every
+    matching row before the LIMIT applies; suits small or narrowly filtered sets. The
+    other modes run their count concurrently with the page, each on its own pool connection.
+    """
+    page_query = query.offset(offset).limit(limit)
+    if total == TotalMode.WINDOW:
+        rows = list(await page_query.annotate(window_total=RawSQL("COUNT(*) OVER()")))
+        if rows:
+            return rows, rows[0].window_total
+        # Past the end there is no row to carry the window total
+        return rows, await query.count() if offset else 0
+    if total == TotalMode.ESTIMATE:
+        counter = estimated_count(query)
+    elif total == TotalMode.CACHED:
+        counter = cached_count(query, count_tags)
+    else:
+        counter = query.count()
+    rows, count = await asyncio.gather(page_query, counter)
+    return list(rows), count
+
+
+async def paginate(
+    query: QuerySet,
+    page: int = 1,
+    count: int = 10,
+    cursor: Optional[str] = None,
+    total: TotalMode = TotalMode.EXACT,
+    count_tags: Sequence[str] = (),
+) -> Tuple[List[Any], dict]:
+    """
+    One page of `query` and its metadata. With `cursor` the page is read by keyset and
+    not counted; otherwise by page number, with a total counted per `total`. For models
+    that `supports_keyset`, the metadata still carries a `next_cursor` so clients can
+    switch to cursors from any page.
+    """
+    keyset = supports_keyset(query.model)
+    if cursor:
+        if not keyset:
+            raise HTTPException(status_code=400, detail="This listing can't be paged by cursor")
+        rows, next_cursor = await keyset_page(query, cursor, count)
+        return rows, {"page_size": count, "next_cursor": next_cursor}
+    offset = (page - 1) * count
+    rows, row_total = await fetch_page(ordered(query) if keyset else query, offset, count, total, count_tags)
+    # An estimate can undershoot, so only exact totals may rule out a next page
+    exact = total in (TotalMode.EXACT, TotalMode.WINDOW)
+    more = len(rows) == count and (not exact or offset + len(rows) < row_total)
+    return rows, {
+        "page": page,
+        "page_size": count,
+        "total": row_total,
+        "total_mode": total.value,
+        "next_cursor": encode_cursor(rows[-1]) if keyset and more else None,
+    }
@@ -1,6 +1,10 @@
 from fastapi import APIRouter
 from typing import List, Optional
+from src.core.ratelimit import RateLimit, RateLimiter
 
 
-def build_router(path: str, tags: Optional[List[str]] = None) -> APIRouter:
-    return APIRouter(prefix=f"/v1/{path}", tags=tags or [])
\ No newline at end of file
+def build_router(path: str, tags: Optional[List[str]] = None, rate_limit: Optional[RateLimit] = None) -> APIRouter:
+    prefix = f"/v1/{path}"
+    if rate_limit:
+        RateLimiter.register(prefix, rate_limit)
+    return APIRouter(prefix=prefix, tags=tags or [])
@@ -0,0 +1,20 @@
+import pytest
+from tortoise import Tortoise
+from src.core.cache import CachingService
+
+
+@pytest.fixture
+async def cache():
+    """The in-memory cache backend, emptied between tests."""
+    await CachingService.open_conn(backend="memory")
+    yield CachingService
+    await CachingService.close_conn()
+
+
+@pytest.fixture
+async def db():
+    """Every model on a fresh in-memory sqlite database."""
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": ["src.core.models"]})
+    await Tortoise.generate_schemas()
+    yield
+    await Tortoise.close_connections()
@@ -0,0 +1,24 @@
+import orjson
+from src.core.cache import INVALIDATION_CHANNEL, CachingService
+
+
+async def test_delete_many_evicts_everywhere(cache, monkeypatch):
+    published = []
+
+    async def publish(channel, message):
+        published.append((channel, message))
+        return 0
+
+    monkeypatch.setattr(CachingService._conn, "publish", publish)
+    await CachingService.set_many({"obj:file:1": "a", "obj:file:2": "b", "obj:file:3": "c"}, 60)
+    assert CachingService._local.get("obj:file:1") is not None
+
+    assert await CachingService.delete_many(["obj:file:1", "obj:file:2", "obj:file:404"]) == 2
+    assert CachingService._local.get("obj:file:1") is None
+    assert await CachingService.get_many(["obj:file:1", "obj:file:2", "obj:file:3"]) == {"obj:file:3": "c"}
+    # Other workers hear which keys to drop from their local tiers
+    assert published == [(INVALIDATION_CHANNEL, orjson.dumps(["obj:file:1", "obj:file:2", "obj:file:404"]))]
+
+
+async def test_delete_many_without_keys_is_a_no_op(cache):
+    assert await CachingService.delete_many([]) == 0
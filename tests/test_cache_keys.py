@@ -0,0 +1,91 @@
+import random
+import httpx
+import pytest
+from fastapi import FastAPI, Query, Request
+from src.core.cache import cache, cache_key
+
+
+def listing_app(fetches: list) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/v1/blogs/")
+    @cache(ttl=60, tags=["blog:*"])
+    async def list_blogs(
+        request: Request,
+        author: str = Query(None),
+        category: str = Query(None),
+        page: int = Query(1, ge=1),
+        count: int = Query(10, ge=1, le=100),
+    ):
+        fetches.append(request.url.query)
+        return {"page": page, "count": count, "category": category}
+
+    @app.get("/v1/blogs/key")
+    async def blog_key(
+        request: Request,
+        author: str = Query(None),
+        category: str = Query(None),
+        page: int = Query(1, ge=1),
+        count: int = Query(10, ge=1, le=100),
+    ):
+        """The key `list_blogs` would use for the same query, uncached."""
+        return cache_key(request, {"request": request, "author": author, "category": category, "page": page, "count": count})
+
+    return app
+
+
+def listing_queries(requests: int, seed: int = 7) -> list:
+    """Query strings the way the frontend, crawlers and shared links send them."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(requests):
+        page = rng.choice([1, 1, 1, 1, 2, 2, 3])
+        params = []
+        if page != 1 or rng.random() < 0.5:
+            params.append(("page", page))
+        if rng.random() < 0.6:
+            params.append(("count", 10))
+        if rng.random() < 0.1:
+            params.append(("category", "News"))
+        if rng.random() < 0.2:
+            params.append(("_", rng.randrange(10**6)))  # cache buster
+        rng.shuffle(params)
+        queries.append("&".join(f"{name}={value}" for name, value in params))
+    return queries
+
+
+async def replay(queries: list) -> tuple:
+    """Each query's cache key, and the queries that missed the cache."""
+    keys, fetches = [], []
+    transport = httpx.ASGITransport(app=listing_app(fetches))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        for query in queries:
+            response = await client.get(f"/v1/blogs/?{query}")
+            assert response.status_code == 200
+            keys.append((await client.get(f"/v1/blogs/key?{query}")).json())
+    return keys, fetches
+
+
+@pytest.mark.parametrize("variants", [
+    ["page=2&count=20", "count=20&page=2"],
+    ["", "page=1", "count=10", "page=1&count=10"],
+    ["page=2", "page=2&_=123", "page=2&utm_source=mail&fbclid=abc"],
+])
+async def test_equivalent_queries_share_one_key(cache, variants):
+    keys, fetches = await replay(variants)
+    assert len(set(keys)) == 1
+    assert len(fetches) == 1
+
+
+async def test_distinct_queries_get_distinct_keys(cache):
+    keys, fetches = await replay(["page=1", "page=2", "page=1&category=News"])
+    assert len(set(keys)) == 3
+    assert len(fetches) == 3
+
+
+async def test_replayed_permutations_hit_ratio(cache):
+    queries = listing_queries(1000)
+    _, fetches = await replay(queries)
+    # 3 pages x with/without category; every other request must be a hit
+    assert len(fetches) <= 6
+    assert 1 - len(fetches) / len(queries) >= 0.99
@@ -0,0 +1,33 @@
+import pytest
+from fastapi import HTTPException, Request
+from src.config.env import LOGIN_LIMIT_PER_IP
+from src.core.ratelimit import LoginThrottle
+from src.utilities import meta
+
+
+def request(forwarded_for: str = None, peer: str = "10.0.0.1") -> Request:
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+    return Request({"type": "http", "method": "POST", "path": "/", "headers": headers, "client": (peer, 5000)})
+
+
+def test_forwarded_for_is_ignored_without_trusted_proxies(monkeypatch):
+    monkeypatch.setattr(meta, "TRUSTED_PROXY_HOPS", 0)
+    assert meta.get_ipaddr(request("1.2.3.4")) == "10.0.0.1"
+
+
+def test_only_the_trusted_hop_is_used(monkeypatch):
+    monkeypatch.setattr(meta, "TRUSTED_PROXY_HOPS", 1)
+    # The client forged the first entry; the proxy appended the real address last
+    assert meta.get_ipaddr(request("1.2.3.4, 203.0.113.9")) == "203.0.113.9"
+    assert meta.get_ipaddr(request()) == "10.0.0.1"
+    monkeypatch.setattr(meta, "TRUSTED_PROXY_HOPS", 2)
+    assert meta.get_ipaddr(request("1.2.3.4, 203.0.113.9, 172.16.0.2")) == "203.0.113.9"
+
+
+async def test_rotating_forwarded_for_does_not_escape_the_login_throttle(cache, monkeypatch):
+    monkeypatch.setattr(meta, "TRUSTED_PROXY_HOPS", 0)
+    for i in range(LOGIN_LIMIT_PER_IP):
+        await LoginThrottle.check(meta.get_ipaddr(request(f"198.51.100.{i}")), f"user{i}@example.com")
+    with pytest.raises(HTTPException) as error:
+        await LoginThrottle.check(meta.get_ipaddr(request("198.51.100.250")), "fresh@example.com")
+    assert error.value.status_code == 429
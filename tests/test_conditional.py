@@ -0,0 +1,54 @@
+import datetime
+import httpx
+from fastapi import FastAPI, Request
+from src.core.cache import cache
+
+UPDATED = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/posts/")
+    @cache(ttl=60, conditional=True)
+    async def list_posts(request: Request):
+        return {"data": [{"title": "post", "body": "x" * 2000, "updated_at": UPDATED}]}
+
+    @app.get("/posts/{id}")
+    @cache(ttl=60, conditional=True)
+    async def get_post(id: str, request: Request):
+        return {"title": "post", "body": "x" * 2000, "updated_at": UPDATED}
+
+    return app
+
+
+async def get(client, url, **headers):
+    return await client.get(url, headers=headers)
+
+
+async def test_each_coding_has_its_own_etag(cache):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app()), base_url="http://test") as client:
+        identity = await get(client, "/posts/1", **{"accept-encoding": "identity"})
+        gzipped = await get(client, "/posts/1", **{"accept-encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert identity.headers["etag"] != gzipped.headers["etag"]
+
+        revalidated = await get(client, "/posts/1", **{"accept-encoding": "gzip", "if-none-match": gzipped.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == gzipped.headers["etag"]
+        assert all(r.headers["vary"] == "Accept-Encoding" for r in (identity, gzipped, revalidated))
+        # The identity validator doesn't match the gzip representation
+        mismatched = await get(client, "/posts/1", **{"accept-encoding": "gzip", "if-none-match": identity.headers["etag"]})
+        assert mismatched.status_code == 200
+
+
+async def test_only_single_objects_carry_last_modified(cache):
+    since = "Wed, 01 Jan 2025 00:00:00 GMT"
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app()), base_url="http://test") as client:
+        detail = await get(client, "/posts/1")
+        assert detail.headers["last-modified"] == since
+        assert (await get(client, "/posts/1", **{"if-modified-since": since})).status_code == 304
+
+        listing = await get(client, "/posts/")
+        assert "last-modified" not in listing.headers
+        assert (await get(client, "/posts/", **{"if-modified-since": since})).status_code == 200
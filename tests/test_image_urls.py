@@ -0,0 +1,48 @@
+from src.apps.auth.user.models import User
+from src.apps.file.models import File
+from src.apps.file.services import FileService
+from src.apps.public.blog import Blog, Category
+from src.apps.public.blog.services import BlogService
+from src.enums.base import ContentStatus
+
+
+async def make_blogs(posts: int, images: int):
+    author = await User.create(email="author@example.com", first_name="Ada", last_name="Writer", password="secret")
+    category = await Category.create(title="News", added_by=author)
+    files = [
+        await File.create(name=f"photo {i}", slug=f"photo-{i}", type="image", url=f"https://cdn/{i}.png", size=1)
+        for i in range(images)
+    ]
+    blogs = []
+    for i in range(posts):
+        blog = await Blog.create(title=f"post {i}", content="...", status=ContentStatus.PUBLISH, category=category, author=author)
+        await blog.images.add(*files)
+        blogs.append(blog)
+    return blogs, files
+
+
+async def test_listing_hydrates_image_urls_from_cache(db, cache, monkeypatch):
+    await make_blogs(posts=3, images=2)
+    loads = []
+    get_many = FileService.boa.get_many
+
+    async def counting_get_many(ids):
+        loads.append(sorted(ids))
+        return await get_many(ids)
+
+    monkeypatch.setattr(FileService.boa, "get_many", counting_get_many)
+
+    first = await BlogService.all()
+    second = await BlogService.all()
+    assert len(loads) == 1  # one id__in load for every image on the page, then cache hits
+    assert first["data"] == second["data"]
+    assert all(sorted(blog["images"]) == ["https://cdn/0.png", "https://cdn/1.png"] for blog in first["data"])
+
+
+async def test_soft_deleted_images_are_left_out(db, cache):
+    blogs, files = await make_blogs(posts=1, images=2)
+    files[0].is_deleted = True
+    await files[0].save()
+
+    detail = await BlogService.get(id=str(blogs[0].id))
+    assert detail["images"] == ["https://cdn/1.png"]
@@ -0,0 +1,74 @@
+import pytest
+from fastapi import Request, Response
+from tortoise.queryset import QuerySet
+from src.apps.auth.user.schemas import UserCreateDto
+from src.apps.auth.user.services import UserService
+from src.apps.public.contact.models import Team
+from src.core.cache import CachingService
+from src.enums.base import TotalMode
+from src.utilities.pagination import paginate
+
+
+@pytest.fixture
+def counts(monkeypatch):
+    """Models of every COUNT query run."""
+    counted = []
+    count = QuerySet.count
+
+    def counting_count(self):
+        counted.append(self.model)
+        return count(self)
+
+    monkeypatch.setattr(QuerySet, "count", counting_count)
+    return counted
+
+
+async def teams(n: int):
+    await Team.bulk_create([Team(name=f"member {i}", position="staff") for i in range(n)])
+
+
+@pytest.mark.parametrize("total", [TotalMode.EXACT, TotalMode.WINDOW, TotalMode.ESTIMATE])
+async def test_every_mode_reports_the_total(db, total):
+    await teams(12)
+    rows, info = await paginate(Team.all(), 2, 5, total=total)
+    assert len(rows) == 5
+    # sqlite has no planner estimate, so ESTIMATE falls back to an exact count
+    assert (info["total"], info["total_mode"]) == (12, total.value)
+
+
+async def test_window_total_past_the_last_page(db):
+    await teams(3)
+    rows, info = await paginate(Team.all(), 3, 5, total=TotalMode.WINDOW)
+    assert rows == [] and info["total"] == 3
+
+
+async def test_cached_total_is_reused_until_its_tag_is_invalidated(db, cache, counts):
+    await teams(7)
+    for page in (1, 2):
+        assert (await paginate(Team.all(), page, 5, total=TotalMode.CACHED, count_tags=["team:*"]))[1]["total"] == 7
+    assert len(counts) == 1
+
+    await teams(1)
+    await CachingService.invalidate("team:*")
+    assert (await paginate(Team.all(), 1, 5, total=TotalMode.CACHED, count_tags=["team:*"]))[1]["total"] == 8
+    assert len(counts) == 2
+
+
+async def signup(email: str):
+    dto = UserCreateDto(email=email, password="secret", first_name="Ada", last_name="Lovelace", other_name=None, has_agreed_to_terms=True)
+    request = Request({"type": "http", "method": "POST", "path": "/v1/users/", "headers": [], "client": ("10.0.0.1", 5000)})
+    await UserService.create_user(dto, request, Response())
+
+
+async def test_cached_user_count_is_reused_and_cleared_on_signup(db, cache, counts):
+    for i in range(3):
+        await signup(f"user{i}@example.com")
+    counts.clear()
+
+    assert (await UserService.all(limit=2))["count"] == 3
+    assert (await UserService.all(limit=2, offset=2))["count"] == 3
+    assert len(counts) == 1  # the second page reused the cached total
+
+    await signup("user3@example.com")
+    assert (await UserService.all(limit=2))["count"] == 4
+    assert len(counts) == 2
@@ -0,0 +1,70 @@
+import pytest
+from argon2 import PasswordHasher
+from fastapi import Request, Response
+from src.apps.auth.user.models import User
+from src.apps.auth.user.schemas import UserCreateDto, UserLogin
+from src.apps.auth.user.services import UserService
+from src.utilities import hash as hashing
+
+PASSWORD = "correct horse battery staple"
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Counts of Argon2 hashes and verifies, whichever path runs them."""
+    counts = {"hash": 0, "verify": 0}
+    set_password, verify_password = hashing.set_password, hashing.verify_password
+
+    def counting_hash(password):
+        counts["hash"] += 1
+        return set_password(password)
+
+    def counting_verify(hashed_password, plain_password):
+        counts["verify"] += 1
+        return verify_password(hashed_password, plain_password)
+
+    monkeypatch.setattr(hashing, "set_password", counting_hash)
+    monkeypatch.setattr(hashing, "verify_password", counting_verify)
+    return counts
+
+
+def request() -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/v1/users/login", "headers": [], "client": ("10.0.0.1", 5000)})
+
+
+async def signup(email: str = "ada@example.com"):
+    dto = UserCreateDto(email=email, password=PASSWORD, first_name="Ada", last_name="Lovelace", other_name=None, has_agreed_to_terms=True)
+    await UserService.create_user(dto, request(), Response())
+    return await User.get(email=email)
+
+
+async def login(email: str = "ada@example.com"):
+    await UserService.login_user(UserLogin(email=email, password=PASSWORD), request(), Response())
+
+
+async def test_create_hashes_once(db, cache, calls):
+    user = await signup()
+    assert calls == {"hash": 1, "verify": 0}
+    assert hashing.verify_password(user.password, PASSWORD)
+
+
+async def test_login_verifies_without_hashing(db, cache, calls):
+    await signup()
+    calls.update(hash=0, verify=0)
+    await login()
+    assert calls == {"hash": 0, "verify": 1}
+
+
+async def test_outdated_hash_is_upgraded_once(db, cache, calls):
+    user = await signup()
+    outdated = PasswordHasher(time_cost=1, memory_cost=8192).hash(PASSWORD)
+    await User.filter(id=user.id).update(password=outdated)
+    calls.update(hash=0, verify=0)
+
+    await login()
+    assert calls == {"hash": 1, "verify": 1}
+    upgraded = (await User.get(id=user.id)).password
+    assert upgraded != outdated and not hashing.ph.check_needs_rehash(upgraded)
+
+    await login()
+    assert calls == {"hash": 1, "verify": 2}
@@ -0,0 +1,45 @@
+import pytest
+from fastapi import HTTPException
+from src.config.env import LOGIN_BLOCK_BASE, LOGIN_LIMIT_PER_EMAIL, LOGIN_LIMIT_PER_IP
+from src.core.cache import CacheUnavailable, CachingService
+from src.core.ratelimit import LoginThrottle
+
+
+async def attempts_until_blocked(ip_address: str, email: str, limit: int) -> HTTPException:
+    for _ in range(limit):
+        await LoginThrottle.check(ip_address, email)
+    with pytest.raises(HTTPException) as error:
+        await LoginThrottle.check(ip_address, email)
+    return error.value
+
+
+async def test_account_is_blocked_after_its_limit(cache):
+    error = await attempts_until_blocked("10.0.0.1", "ada@example.com", LOGIN_LIMIT_PER_EMAIL)
+    assert error.status_code == 429
+    assert int(error.headers["Retry-After"]) == LOGIN_BLOCK_BASE
+    # Other accounts from another address are unaffected
+    await LoginThrottle.check("10.0.0.2", "grace@example.com")
+
+
+async def test_ip_is_blocked_across_accounts(cache):
+    for i in range(LOGIN_LIMIT_PER_IP):
+        await LoginThrottle.check("10.0.0.1", f"user{i}@example.com")
+    with pytest.raises(HTTPException) as error:
+        await LoginThrottle.check("10.0.0.1", "fresh@example.com")
+    assert error.value.status_code == 429
+
+
+async def test_successful_login_clears_the_account_window(cache):
+    for _ in range(LOGIN_LIMIT_PER_EMAIL):
+        await LoginThrottle.check("10.0.0.1", "ada@example.com")
+    await LoginThrottle.reset("ada@example.com")
+    await LoginThrottle.check("10.0.0.1", "ada@example.com")
+
+
+async def test_logins_go_through_when_redis_is_down(cache, monkeypatch):
+    async def unavailable(*args, **kwargs):
+        raise CacheUnavailable("down")
+
+    monkeypatch.setattr(CachingService, "_call", unavailable)
+    for _ in range(LOGIN_LIMIT_PER_EMAIL + 1):
+        await LoginThrottle.check("10.0.0.1", "ada@example.com")
@@ -0,0 +1,66 @@
+import base64
+import datetime
+import orjson
+import pytest
+from fastapi import HTTPException
+from src.apps.public.contact.models import Team
+from src.apps.auth.permisssion import Permission
+from src.enums.base import Action, Resource
+from src.utilities.base_service import BaseObjectService
+from src.utilities.pagination import decode_cursor, paginate
+
+
+def forge(*values) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    forge("2025-01-01T00:00:00", "1 OR 1=1"),
+    forge("2025-01-01T00:00:00", 42),
+    forge("yesterday", "6f1c1f5e-0000-4000-8000-000000000000"),
+    forge("2025-01-01T00:00:00"),
+])
+def test_tampered_cursor_is_a_bad_request(cursor):
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor)
+    assert error.value.status_code == 400
+
+
+async def test_cursor_walk_matches_page_numbers(db):
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    # Pairs share a timestamp, so ties must be settled by id
+    await Team.bulk_create([Team(name=f"member {i}", position="staff", created_at=start + datetime.timedelta(seconds=i // 2)) for i in range(25)])
+    query = Team.filter(is_deleted=False)
+
+    by_page, page = [], 1
+    while rows := (await paginate(query, page, 10))[0]:
+        by_page += [row.id for row in rows]
+        page += 1
+
+    # Page 1 is read by number; its next_cursor starts the walk
+    rows, info = await paginate(query, 1, 10)
+    by_cursor = [row.id for row in rows]
+    while cursor := info["next_cursor"]:
+        rows, info = await paginate(query, count=10, cursor=cursor)
+        by_cursor += [row.id for row in rows]
+
+    assert len(by_page) == 25
+    assert by_cursor == by_page
+
+
+async def test_models_without_the_keyset_index_keep_their_ordering(db):
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    await Permission.bulk_create([
+        Permission(action=Action.READ, resource=Resource.PUBLIC, created_at=start + datetime.timedelta(seconds=i))
+        for i in range(3)
+    ])
+    boa = BaseObjectService(Permission)
+
+    page = await boa.all(count=2)
+    # Meta.ordering, oldest first
+    assert [p.created_at for p in page["results"]] == [start, start + datetime.timedelta(seconds=1)]
+    assert page["next_cursor"] is None
+    with pytest.raises(HTTPException) as error:
+        await boa.all(cursor=forge(start.isoformat(), "6f1c1f5e-0000-4000-8000-000000000000"))
+    assert error.value.status_code == 400
@@ -0,0 +1,15 @@
+from src.apps.auth.user.models import User
+from src.apps.auth.user.schemas import UpdateUserSchema
+from src.apps.auth.user.services import UserService
+from src.dependencies.permissions.base import ALL_PERMISSIONS, AuthPermissionService
+
+
+async def test_user_update_recompiles_a_cached_superuser_mask(db, cache):
+    user = await User.create(email="root@example.com", first_name="Root", last_name="Admin", password="secret", is_superuser=True)
+    assert await AuthPermissionService.permission_mask(str(user.id)) == ALL_PERMISSIONS
+
+    await User.filter(id=user.id).update(is_superuser=False)
+    dto = UpdateUserSchema(email=user.email, password="secret", first_name="Root", last_name="Admin", other_name=None, has_agreed_to_terms=True)
+    await UserService.update_user(str(user.id), dto)
+
+    assert await AuthPermissionService.permission_mask(str(user.id)) == 0
@@ -0,0 +1,59 @@
+import httpx
+from fastapi import FastAPI
+from src.core.ratelimit import RateLimit, RateLimiter
+from src.dependencies.middlewares.ratelimitmiddleware import RateLimitMiddleware
+from src.utilities.route_builder import build_router
+
+
+def app(policy: RateLimit) -> FastAPI:
+    router = build_router("limited", rate_limit=policy)
+
+    @router.get("/")
+    async def listing():
+        return []
+
+    @router.post("/")
+    async def signup():
+        return {}
+
+    @router.post("/logout")
+    async def logout():
+        return {}
+
+    app = FastAPI()
+    app.include_router(router)
+    app.add_middleware(RateLimitMiddleware)
+    return app
+
+
+def client(app: FastAPI, ip_address: str = "10.0.0.1") -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app, client=(ip_address, 5000)), base_url="http://test")
+
+
+async def test_client_gets_its_burst_then_429(cache, monkeypatch):
+    monkeypatch.setattr(RateLimiter, "policies", {})
+    async with client(app(RateLimit(per_minute=1, burst=2, methods=("POST",)))) as c:
+        statuses = [(await c.post("/v1/limited/")).status_code for _ in range(3)]
+        throttled = await c.post("/v1/limited/")
+        assert statuses == [200, 200, 429]
+        assert int(throttled.headers["Retry-After"]) > 0
+        # Methods the policy doesn't name are never limited
+        assert (await c.get("/v1/limited/")).status_code == 200
+
+
+async def test_route_bucket_caps_all_clients_together(cache, monkeypatch):
+    monkeypatch.setattr(RateLimiter, "policies", {})
+    limited = app(RateLimit(per_minute=60, burst=5, route_per_minute=1, route_burst=3, methods=("POST",)))
+    statuses = []
+    for i in range(4):
+        async with client(limited, f"10.0.0.{i}") as c:
+            statuses.append((await c.post("/v1/limited/")).status_code)
+    assert statuses == [200, 200, 200, 429]
+
+
+async def test_throttled_client_can_still_log_out(cache, monkeypatch):
+    monkeypatch.setattr(RateLimiter, "policies", {})
+    async with client(app(RateLimit(per_minute=1, burst=2, methods=("POST",), exempt=("/logout",)))) as c:
+        statuses = [(await c.post("/v1/limited/")).status_code for _ in range(3)]
+        assert statuses == [200, 200, 429]
+        assert (await c.post("/v1/limited/logout")).status_code == 200
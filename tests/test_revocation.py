@@ -0,0 +1,60 @@
+import asyncio
+import time
+import pytest
+from src.core.cache import CachingService
+from src.core.revocation import REVOKED_INDEX, BloomFilter, TokenDenylist
+
+
+@pytest.fixture
+def denylist(cache, monkeypatch):
+    """A fresh filter that isn't due for a rebuild."""
+    monkeypatch.setattr(TokenDenylist, "_filter", BloomFilter())
+    monkeypatch.setattr(TokenDenylist, "_rebuild_due", time.monotonic() + 3600)
+    monkeypatch.setattr(TokenDenylist, "_retry_at", 0.0)
+    monkeypatch.setattr(TokenDenylist, "_rebuilding", None)
+    return TokenDenylist
+
+
+async def test_rebuild_when_due_drops_expired_tokens(denylist, monkeypatch):
+    for jti in ("a", "b"):
+        await denylist.revoke(jti, time.time() + 60)
+    await CachingService._call("zadd", REVOKED_INDEX, {"expired": time.time() - 1})
+    denylist._filter.add("expired")
+
+    monkeypatch.setattr(TokenDenylist, "_rebuild_due", 0.0)
+    assert not await denylist.is_revoked("unknown")
+    await denylist._rebuilding
+
+    assert denylist._filter.count == 2
+    assert "expired" not in denylist._filter and "a" in denylist._filter
+    assert await CachingService._call("zrangebyscore", REVOKED_INDEX, "-inf", "+inf") == [b"a", b"b"]
+
+
+async def test_rebuild_when_over_capacity_grows_the_filter(denylist, monkeypatch):
+    monkeypatch.setattr(TokenDenylist, "_filter", BloomFilter(bits=64, hashes=7))
+    for i in range(10):
+        await denylist.revoke(f"jti-{i}", time.time() + 60)
+    await denylist._rebuilding
+
+    assert denylist._filter.capacity >= 20
+    assert all(f"jti-{i}" in denylist._filter for i in range(10))
+
+
+async def test_revocations_during_a_rebuild_survive_it(denylist, monkeypatch):
+    await denylist.revoke("before", time.time() + 60)
+    call = CachingService._call
+    reading = asyncio.Event()
+
+    async def slow_call(command, *args, **kwargs):
+        if command == "zrangebyscore":
+            reading.set()
+            await asyncio.sleep(0.05)
+        return await call(command, *args, **kwargs)
+
+    monkeypatch.setattr(CachingService, "_call", slow_call)
+    rebuild = asyncio.create_task(denylist.resync())
+    await reading.wait()
+    denylist._remember("during")  # as the pub/sub handler would
+    await rebuild
+
+    assert "before" in denylist._filter and "during" in denylist._filter